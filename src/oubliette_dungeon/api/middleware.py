@@ -193,25 +193,35 @@ class _UnifiedStorageAdapter:
             payload = {**payload, "_caller_key_hint": caller_key_hint}
         self._b.save_redteam_result(payload, session_id)
 
-    def get_session(self, session_id, caller_key_hint=None):
+    def get_session(self, session_id, caller_key_hint=None, include_results=True):
         data = self._b.get_redteam_session(session_id)
         if data is None:
             return None
         if caller_key_hint is not None and data.get("created_by_key_hint") != caller_key_hint:
             return None
+        if not include_results:
+            return {k: v for k, v in data.items() if k != "results"}
         return data
 
+    def get_sessions(self, session_ids, caller_key_hint=None):
+        docs = {sid: self.get_session(sid, caller_key_hint) for sid in dict.fromkeys(session_ids)}
+        return {sid: doc for sid, doc in docs.items() if doc is not None}
+
     def list_sessions(self, caller_key_hint=None):
         sessions = self._b.list_redteam_sessions()
         if caller_key_hint is None:
             return sessions
         return [s for s in sessions if s.get("created_by_key_hint") == caller_key_hint]
 
-    def get_latest_session(self, caller_key_hint=None):
+    def get_latest_session(self, caller_key_hint=None, include_results=True):
         sessions = self.list_sessions(caller_key_hint=caller_key_hint)
         if not sessions:
             return None
-        return self.get_session(sessions[0]["session_id"], caller_key_hint=caller_key_hint)
+        return self.get_session(
+            sessions[0]["session_id"],
+            caller_key_hint=caller_key_hint,
+            include_results=include_results,
+        )
 
     def get_statistics(self, session_id=None):
         return self._b.get_redteam_statistics(session_id)
@@ -94,7 +94,7 @@ def get_summary(session_id):
     db = _get_results_db()
     # Verify ownership first -- get_statistics doesn't know about key hints,
     # so we gate via get_session to avoid disclosing another caller's stats.
-    session = db.get_session(session_id, caller_key_hint=_caller_hint())
+    session = db.get_session(session_id, caller_key_hint=_caller_hint(), include_results=False)
     if not session:
         return jsonify({"error": f"Session not found: {session_id}"}), 404
     stats = db.get_statistics(session_id)
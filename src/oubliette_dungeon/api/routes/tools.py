@@ -337,18 +337,23 @@ def compare_tools():
     db = _get_results_db()
     sessions = db.list_sessions()
 
-    tool_results = {}
+    # Group by tool prefix
+    tool_sessions = []
     for session_info in sessions:
         sid = session_info.get("session_id", "")
-        # Group by tool prefix
         for tool_name in ("pyrit", "deepteam"):
             if sid.startswith(f"{tool_name}_"):
-                session_data = db.get_session(sid)
-                if session_data:
-                    raw_results = session_data.get("results", [])
-                    if tool_name not in tool_results:
-                        tool_results[tool_name] = []
-                    tool_results[tool_name].extend(raw_results)
+                tool_sessions.append((tool_name, sid))
+
+    session_docs = db.get_sessions(sid for _, sid in tool_sessions)
+    tool_results = {}
+    for tool_name, sid in tool_sessions:
+        session_data = session_docs.get(sid)
+        if session_data:
+            raw_results = session_data.get("results", [])
+            if tool_name not in tool_results:
+                tool_results[tool_name] = []
+            tool_results[tool_name].extend(raw_results)
 
     # Build comparison stats
     comparison = {"tools": {}}
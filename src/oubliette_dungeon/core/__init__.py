@@ -14,6 +14,7 @@ from oubliette_dungeon.core.models import (
     AttackTestResult,
     DifficultyLevel,
     TestResult,
+    to_dict,
 )
 from oubliette_dungeon.core.offline import OfflineExecutor
 from oubliette_dungeon.core.orchestrator import RedTeamOrchestrator
@@ -35,6 +36,7 @@ __all__ = [
     "AttackTestResult",
     "DifficultyLevel",
     "TestResult",
+    "to_dict",
     "ScenarioLoader",
     "AttackExecutor",
     "ResultEvaluator",
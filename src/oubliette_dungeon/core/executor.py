@@ -8,9 +8,16 @@ import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from oubliette_dungeon.core.models import AttackScenario
 
+# One long-lived session serves every scenario in a run; size its pool so
+# concurrent callers sharing an executor reuse connections instead of
+# opening (and TLS-handshaking) a fresh one per request.
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
 # Severity ordering used to collapse per-turn pipeline verdicts into a single
 # "most severe" verdict for multi-turn scenarios. Unknown non-null verdicts
 # rank above SAFE but below MALICIOUS so a stray label never masks a hit.
@@ -72,6 +79,10 @@ class AttackExecutor:
         self.target_url = target_url
         self.timeout = timeout
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def execute_single_turn(self, scenario: AttackScenario) -> tuple[str, float]:
         start_time = time.time()
@@ -81,7 +92,6 @@ class AttackExecutor:
                 self.target_url,
                 json={"message": scenario.prompt},
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"},
             )
 
             elapsed_ms = (time.time() - start_time) * 1000
@@ -124,7 +134,6 @@ class AttackExecutor:
                     self.target_url,
                     json={"message": prompt},
                     timeout=self.timeout,
-                    headers={"Content-Type": "application/json"},
                 )
 
                 if response.status_code == 200:
@@ -7,6 +7,8 @@ Loads attack scenarios from YAML files with filtering capabilities.
 import hashlib
 import logging
 import os
+from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +16,15 @@ import yaml
 
 from oubliette_dungeon.core.models import AttackScenario
 
+# Safe YAML loader shared by the package's YAML readers. libyaml's C parser
+# is several times faster than the pure-Python one and still only constructs
+# plain Python types. PyYAML wheels ship with it, but source builds without
+# libyaml headers do not, so fall back gracefully.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
 
@@ -87,10 +98,11 @@ class ScenarioLoader:
     def load_scenarios(self) -> None:
         """Load scenarios from YAML file"""
         self.scenarios = []
+        self._invalidate_indexes()
 
         try:
             with open(self.scenario_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlSafeLoader)
 
             if not data:
                 return
@@ -139,17 +151,43 @@ class ScenarioLoader:
     def list_all(self) -> list[AttackScenario]:
         return self.get_all_scenarios()
 
+    # Lookup indexes are built on first use and dropped whenever
+    # load_scenarios() replaces the scenario list.
+    _INDEX_ATTRS = ("_by_id", "_by_category", "_by_difficulty")
+
+    def _invalidate_indexes(self) -> None:
+        for attr in self._INDEX_ATTRS:
+            self.__dict__.pop(attr, None)
+
+    @cached_property
+    def _by_id(self) -> dict[str, AttackScenario]:
+        index: dict[str, AttackScenario] = {}
+        for s in self.scenarios:
+            index.setdefault(s.id, s)  # first occurrence wins, as in a linear scan
+        return index
+
+    @cached_property
+    def _by_category(self) -> dict[str, list[AttackScenario]]:
+        index: defaultdict[str, list[AttackScenario]] = defaultdict(list)
+        for s in self.scenarios:
+            index[s.category].append(s)
+        return dict(index)
+
+    @cached_property
+    def _by_difficulty(self) -> dict[str, list[AttackScenario]]:
+        index: defaultdict[str, list[AttackScenario]] = defaultdict(list)
+        for s in self.scenarios:
+            index[s.difficulty.lower()].append(s)
+        return dict(index)
+
     def get_by_category(self, category: str) -> list[AttackScenario]:
-        return [s for s in self.scenarios if s.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_by_difficulty(self, difficulty: str) -> list[AttackScenario]:
-        return [s for s in self.scenarios if s.difficulty.lower() == difficulty.lower()]
+        return list(self._by_difficulty.get(difficulty.lower(), ()))
 
     def get_by_id(self, scenario_id: str) -> AttackScenario | None:
-        for scenario in self.scenarios:
-            if scenario.id == scenario_id:
-                return scenario
-        return None
+        return self._by_id.get(scenario_id)
 
     def get_owasp_scenarios(self, owasp_id: str) -> list[AttackScenario]:
         return [s for s in self.scenarios if owasp_id in s.owasp_mapping]
@@ -5,9 +5,10 @@ Defines enums, dataclasses, and constants shared across the engine.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import Any
 
 DEFAULT_TARGET_URL = os.getenv("DUNGEON_TARGET_URL", "http://localhost:5000/api/chat")
@@ -104,3 +105,27 @@ class AttackTestResult:
 
 # Backward-compatibility alias
 TestResult = AttackTestResult
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def to_dict(obj: Any) -> dict[str, Any]:
+    """Serialize a flat model dataclass (scenario or result) to a dict.
+
+    Equivalent to ``dataclasses.asdict`` for these models, but skips its
+    recursive deepcopy walk: field names are cached per class and only the
+    top-level list/dict values are copied, which is all the flat models
+    need to keep the returned dict independent of the instance.
+    """
+    out: dict[str, Any] = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        out[name] = value
+    return out
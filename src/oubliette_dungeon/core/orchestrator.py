@@ -6,7 +6,7 @@ Coordinates scenario loading, execution, evaluation, and reporting.
 
 import json
 import uuid
-from dataclasses import asdict
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +17,7 @@ from oubliette_dungeon.core.metrics import avg_risk_density, avg_turns_to_jailbr
 from oubliette_dungeon.core.models import (
     AttackResult,
     AttackTestResult,
+    to_dict,
 )
 
 
@@ -189,48 +190,35 @@ class RedTeamOrchestrator:
         if not results:
             return {"error": "No results to summarize"}
 
-        summary: dict[str, Any] = {
-            "schema_version": "1.0",
-            "tool": "oubliette-dungeon",
-            "tool_version": "1.0.0",
-            "total_tests": len(results),
-            "session_id": self.current_session_id,
-            "timestamp": datetime.now().isoformat(),
-            "by_result": {},
-            "by_category": {},
-            "by_difficulty": {},
-            "avg_execution_time_ms": 0.0,
-            "detection_rate": 0.0,
-            "bypass_rate": 0.0,
-            "avg_confidence": 0.0,
-        }
-
+        by_result: Counter[str] = Counter()
+        by_category: Counter[str] = Counter()
+        by_difficulty: Counter[str] = Counter()
         total_time: float = 0.0
         total_confidence: float = 0.0
-        detected_count = 0
-        bypass_count = 0
 
         for result in results:
-            summary["by_result"][result.result] = summary["by_result"].get(result.result, 0) + 1
-            summary["by_category"][result.category] = (
-                summary["by_category"].get(result.category, 0) + 1
-            )
-            summary["by_difficulty"][result.difficulty] = (
-                summary["by_difficulty"].get(result.difficulty, 0) + 1
-            )
-
+            by_result[result.result] += 1
+            by_category[result.category] += 1
+            by_difficulty[result.difficulty] += 1
             total_time += result.execution_time_ms
             total_confidence += result.confidence
 
-            if result.result == AttackResult.SUCCESS_DETECTED.value:
-                detected_count += 1
-            elif result.result == AttackResult.SUCCESS_BYPASS.value:
-                bypass_count += 1
-
-        summary["avg_execution_time_ms"] = total_time / len(results)
-        summary["avg_confidence"] = total_confidence / len(results)
-        summary["detection_rate"] = (detected_count / len(results)) * 100
-        summary["bypass_rate"] = (bypass_count / len(results)) * 100
+        n = len(results)
+        summary: dict[str, Any] = {
+            "schema_version": "1.0",
+            "tool": "oubliette-dungeon",
+            "tool_version": "1.0.0",
+            "total_tests": n,
+            "session_id": self.current_session_id,
+            "timestamp": datetime.now().isoformat(),
+            "by_result": dict(by_result),
+            "by_category": dict(by_category),
+            "by_difficulty": dict(by_difficulty),
+            "avg_execution_time_ms": total_time / n,
+            "detection_rate": by_result[AttackResult.SUCCESS_DETECTED.value] / n * 100,
+            "bypass_rate": by_result[AttackResult.SUCCESS_BYPASS.value] / n * 100,
+            "avg_confidence": total_confidence / n,
+        }
 
         summary["pass_at_1"] = pass_at_k(results, 1)
         summary["pass_at_5"] = pass_at_k(results, 5)
@@ -249,7 +237,7 @@ class RedTeamOrchestrator:
             "timestamp": datetime.now().isoformat(),
             "session_id": self.current_session_id,
             "aggregate": summary,
-            "results": [asdict(r) for r in results],
+            "results": [to_dict(r) for r in results],
         }
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(report, f, indent=2, default=str)
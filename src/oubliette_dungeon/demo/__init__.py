@@ -23,6 +23,8 @@ def load_fixtures(db_dir: str = "redteam_results") -> None:
 
     for result in data.get("results", []):
         db.save_result(result, session_id)
+    # The dashboard started right after this opens its own database.
+    db.flush()
 
     print(f"Loaded {len(data.get('results', []))} fixture results into session {session_id}")
 
@@ -19,6 +19,8 @@ Usage:
     scheduler.run_now(target_url="http://localhost:5000/api/chat")
 """
 
+import atexit
+import heapq
 import json
 import os
 import stat
@@ -26,7 +28,10 @@ import sys
 import threading
 import time
 import uuid
+import weakref
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from oubliette_dungeon.core.models import DEFAULT_TARGET_URL
@@ -60,64 +65,191 @@ CRON_ALIASES = {
 }
 
 
+def _span_mask(lo, hi):
+    """Bitmask with bits ``lo``..``hi`` inclusive set (empty when hi < lo)."""
+    if hi < lo:
+        return 0
+    return ((1 << (hi + 1)) - 1) ^ ((1 << lo) - 1)
+
+
 class CronExpression:
-    """Minimal cron expression parser."""
+    """Minimal cron expression parser.
+
+    Each field is compiled at parse time into an int bitmask (bit ``n`` set
+    when value ``n`` is allowed), so ``matches`` is a handful of shifts and
+    ANDs rather than five set lookups. The ``minute``/``hour``/``day``/
+    ``month``/``weekday`` attributes remain available as sets.
+    """
 
     def __init__(self, expr):
-        self.raw = expr.strip()
-        if self.raw in CRON_ALIASES:
-            self.raw = CRON_ALIASES[self.raw]
-        parts = self.raw.split()
+        self.raw, masks = self._compile(expr.strip())
+        (
+            self.minute_mask,
+            self.hour_mask,
+            self.day_mask,
+            self.month_mask,
+            self.weekday_mask,
+        ) = masks
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _compile(cls, expr):
+        """Parse ``expr`` into ``(raw, masks)``; cached per expression.
+
+        Jobs are often templated from the same few schedules and every
+        scheduler pass re-reads the cron string of each job, so repeat
+        parses are a dict lookup.
+        """
+        raw = CRON_ALIASES.get(expr, expr)
+        parts = raw.split()
         if len(parts) != 5:
             raise ValueError(
                 f"Invalid cron expression: '{expr}'. "
                 "Expected 5 fields: minute hour day month weekday"
             )
-        self.minute = self._parse_field(parts[0], 0, 59)
-        self.hour = self._parse_field(parts[1], 0, 23)
-        self.day = self._parse_field(parts[2], 1, 31)
-        self.month = self._parse_field(parts[3], 1, 12)
-        self.weekday = self._parse_field(parts[4], 0, 6)
+        masks = (
+            cls._parse_field(parts[0], 0, 59),
+            cls._parse_field(parts[1], 0, 23),
+            cls._parse_field(parts[2], 1, 31),
+            cls._parse_field(parts[3], 1, 12),
+            cls._parse_field(parts[4], 0, 6),
+        )
+        return raw, masks
+
+    def _masks(self):
+        return (
+            self.minute_mask,
+            self.hour_mask,
+            self.day_mask,
+            self.month_mask,
+            self.weekday_mask,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CronExpression):
+            return NotImplemented
+        return self._masks() == other._masks()
+
+    def __hash__(self):
+        return hash(self._masks())
 
     @staticmethod
     def _parse_field(field, min_val, max_val):
-        values = set()
+        mask = 0
         for part in field.split(","):
             if part == "*":
-                values.update(range(min_val, max_val + 1))
+                mask |= _span_mask(min_val, max_val)
             elif part.startswith("*/"):
                 step = int(part[2:])
                 if step <= 0:
                     raise ValueError(f"Invalid step: {part}")
-                values.update(range(min_val, max_val + 1, step))
+                for value in range(min_val, max_val + 1, step):
+                    mask |= 1 << value
             elif "-" in part:
                 lo, hi = part.split("-", 1)
-                lo, hi = int(lo), int(hi)
-                values.update(range(lo, hi + 1))
+                mask |= _span_mask(int(lo), int(hi))
             else:
-                values.add(int(part))
-        return values
+                mask |= 1 << int(part)
+        return mask
+
+    @staticmethod
+    def _mask_values(mask):
+        return {n for n in range(mask.bit_length()) if (mask >> n) & 1}
+
+    @property
+    def minute(self):
+        return self._mask_values(self.minute_mask)
+
+    @property
+    def hour(self):
+        return self._mask_values(self.hour_mask)
+
+    @property
+    def day(self):
+        return self._mask_values(self.day_mask)
+
+    @property
+    def month(self):
+        return self._mask_values(self.month_mask)
+
+    @property
+    def weekday(self):
+        return self._mask_values(self.weekday_mask)
 
     def matches(self, dt):
-        return (
-            dt.minute in self.minute
-            and dt.hour in self.hour
-            and dt.day in self.day
-            and dt.month in self.month
-            and dt.weekday() in self.weekday
+        return bool(
+            (self.minute_mask >> dt.minute)
+            & (self.hour_mask >> dt.hour)
+            & (self.day_mask >> dt.day)
+            & (self.month_mask >> dt.month)
+            & (self.weekday_mask >> dt.weekday())
+            & 1
         )
 
+    @staticmethod
+    def _next_value(mask, start, max_val):
+        """Smallest allowed value >= ``start`` in ``mask``, or None."""
+        rest = mask >> start
+        if not rest:
+            return None
+        value = start + (rest & -rest).bit_length() - 1
+        return value if value <= max_val else None
+
     def next_run(self, after=None):
+        """Next matching minute strictly after ``after``, within a year.
+
+        Skips whole months, days and hours that cannot match instead of
+        testing every minute, so a daily job costs a few steps rather than
+        hundreds of ``matches`` calls.
+        """
         if after is None:
             after = datetime.now()
         candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
         limit = after + timedelta(days=366)
         while candidate < limit:
-            if self.matches(candidate):
-                return candidate
-            candidate += timedelta(minutes=1)
+            if not (self.month_mask >> candidate.month) & 1:
+                # day=1 goes in the same replace: Jan 31 -> Feb 31 would raise.
+                if candidate.month == 12:
+                    candidate = candidate.replace(
+                        year=candidate.year + 1, month=1, day=1, hour=0, minute=0
+                    )
+                else:
+                    candidate = candidate.replace(
+                        month=candidate.month + 1, day=1, hour=0, minute=0
+                    )
+                continue
+            if not (
+                (self.day_mask >> candidate.day) & (self.weekday_mask >> candidate.weekday()) & 1
+            ):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            hour = self._next_value(self.hour_mask, candidate.hour, 23)
+            if hour is None:
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+            minute = self._next_value(self.minute_mask, candidate.minute, 59)
+            if minute is None:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            candidate = candidate.replace(minute=minute)
+            return candidate if candidate < limit else None
         return None
 
+    def next_runs(self, after=None, count=10):
+        """Yield up to ``count`` successive fire times after ``after``.
+
+        Each time is derived from the previous one rather than rescanned
+        from ``after``.
+        """
+        when = after
+        for _ in range(count):
+            when = self.next_run(after=when)
+            if when is None:
+                return
+            yield when
+
 
 SCHEDULES_FILE = os.getenv(
     "DUNGEON_SCHEDULES_FILE",
@@ -131,6 +263,28 @@ HISTORY_FILE = os.getenv(
 
 MAX_HISTORY = 200
 
+# Fire times precomputed per job, so a frequently firing job only derives
+# its schedule once every _RUN_HORIZON runs.
+_RUN_HORIZON = 10
+
+# Job mutations within this window are coalesced into one schedules write.
+_FLUSH_DELAY_SECONDS = 0.5
+
+# Schedulers with a schedules write still pending; flushed at interpreter
+# exit, since the flush timer is a daemon thread and would be dropped.
+_DIRTY_SCHEDULERS: "weakref.WeakSet[RedTeamScheduler]" = weakref.WeakSet()
+
+
+def _flush_dirty_schedulers():
+    for scheduler in list(_DIRTY_SCHEDULERS):
+        scheduler.flush()
+
+
+atexit.register(_flush_dirty_schedulers)
+
+# Upper bound on a single wait, so wall-clock jumps are noticed promptly.
+_MAX_WAIT_SECONDS = 30.0
+
 
 class RedTeamScheduler:
     """Continuous red teaming scheduler with cron-like job scheduling."""
@@ -141,8 +295,19 @@ class RedTeamScheduler:
         self._lock = threading.RLock()
         self._running = False
         self._thread = None
+        self._dirty = False
+        self._flush_timer = None
         self._jobs = self._load_jobs()
         self._history = self._load_history()
+        self._upcoming = {}
+        # Min-heap of (due timestamp, job_id, next_run) entries. Entries are
+        # never removed in place: cancelled, disabled or rescheduled jobs are
+        # recognised as stale when popped.
+        self._heap = []
+        self._wakeup = threading.Condition(self._lock)
+        with self._lock:
+            for job_id, job in self._jobs.items():
+                self._push_job(job_id, job)
 
     def _load_jobs(self):
         try:
@@ -153,9 +318,35 @@ class RedTeamScheduler:
             return {}
 
     def _save_jobs(self):
-        with open(self.schedules_file, "w", encoding="utf-8") as f:
-            json.dump({"jobs": self._jobs}, f, indent=2)
-        self._restrict_file(self.schedules_file)
+        """Mark jobs dirty; a timer writes them out shortly afterwards.
+
+        Bulk job creation used to rewrite the whole schedules file on every
+        call. Caller holds ``self._lock``; call ``flush()`` to persist now.
+        """
+        self._dirty = True
+        _DIRTY_SCHEDULERS.add(self)
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(_FLUSH_DELAY_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write pending job changes to the schedules file atomically."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            _DIRTY_SCHEDULERS.discard(self)
+            if not self._dirty:
+                return
+            tmp = f"{self.schedules_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"jobs": self._jobs}, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            self._restrict_file(tmp)
+            os.replace(tmp, self.schedules_file)
+            self._dirty = False
 
     def _load_history(self):
         try:
@@ -191,9 +382,8 @@ class RedTeamScheduler:
         timeout=30,
         enabled=True,
     ):
-        CronExpression(cron)
-        job_id = str(uuid.uuid4())[:8]
         cron_obj = CronExpression(cron)
+        job_id = str(uuid.uuid4())[:8]
         next_run = cron_obj.next_run()
 
         effective_url = target_url or os.getenv("DUNGEON_TARGET_URL", DEFAULT_TARGET_URL)
@@ -220,6 +410,7 @@ class RedTeamScheduler:
         with self._lock:
             self._jobs[job_id] = job
             self._save_jobs()
+            self._push_job(job_id, job)
 
         print(f"[SCHEDULER] Job created: {job_id} ({name}) - next run: {next_run}")
         return job_id
@@ -235,8 +426,7 @@ class RedTeamScheduler:
         )
         with self._lock:
             self._jobs[job_id]["one_time"] = True
-            self._jobs[job_id]["next_run"] = when.isoformat()
-            self._save_jobs()
+            self._set_next_run(job_id, self._jobs[job_id], when)
         return job_id
 
     def list_jobs(self):
@@ -273,16 +463,18 @@ class RedTeamScheduler:
                 if key in allowed_fields:
                     job[key] = value
             if "cron" in updates:
-                cron_obj = CronExpression(updates["cron"])
-                next_run = cron_obj.next_run()
-                job["next_run"] = next_run.isoformat() if next_run else None
-            self._save_jobs()
+                self._upcoming.pop(job_id, None)
+                self._set_next_run(job_id, job, CronExpression(updates["cron"]).next_run())
+            else:
+                self._save_jobs()
+                self._push_job(job_id, job)
             return job
 
     def cancel_job(self, job_id):
         with self._lock:
             if job_id in self._jobs:
                 del self._jobs[job_id]
+                self._upcoming.pop(job_id, None)
                 self._save_jobs()
                 print(f"[SCHEDULER] Job cancelled: {job_id}")
                 return True
@@ -410,16 +602,15 @@ class RedTeamScheduler:
             self._history.append(result)
             self._save_history()
             if job_id and job_id in self._jobs:
-                self._jobs[job_id]["last_run"] = result.get("completed_at", started_at)
+                job = self._jobs[job_id]
+                job["last_run"] = result.get("completed_at", started_at)
+                if job.get("one_time"):
+                    job["enabled"] = False
                 try:
-                    cron_obj = CronExpression(self._jobs[job_id]["cron"])
-                    next_run = cron_obj.next_run()
-                    self._jobs[job_id]["next_run"] = next_run.isoformat() if next_run else None
+                    cron_obj = CronExpression(job["cron"])
+                    self._set_next_run(job_id, job, cron_obj.next_run())
                 except ValueError:
-                    pass
-                if self._jobs[job_id].get("one_time"):
-                    self._jobs[job_id]["enabled"] = False
-                self._save_jobs()
+                    self._save_jobs()
 
         if job_id:
             with self._lock:
@@ -489,52 +680,102 @@ class RedTeamScheduler:
         print("[SCHEDULER] Started")
 
     def stop(self):
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
+        self.flush()
         print("[SCHEDULER] Stopped")
 
-    def _scheduler_loop(self):
-        while self._running:
+    def _set_next_run(self, job_id, job, when):
+        """Record a job's next fire time, persist it and queue it.
+
+        Every ``next_run`` change after creation goes through here: the loop
+        skips heap entries whose time no longer matches the job, so a new
+        time that is not pushed would never fire. Caller holds the lock.
+        """
+        job["next_run"] = when.isoformat() if when else None
+        self._save_jobs()
+        self._push_job(job_id, job)
+
+    def _push_job(self, job_id, job):
+        """Queue a job's next_run on the wakeup heap. Caller holds the lock."""
+        next_run_str = job.get("next_run")
+        if not next_run_str or not job.get("enabled", True):
+            return
+        try:
+            due = datetime.fromisoformat(next_run_str).timestamp()
+        except ValueError:
+            return
+        heapq.heappush(self._heap, (due, job_id, next_run_str))
+        self._wakeup.notify()
+
+    def _pop_upcoming(self, job_id, job, now):
+        """Next fire time after ``now`` from the job's precomputed horizon.
+
+        Caller must hold ``self._lock``. The horizon is refilled from the
+        cron expression once exhausted (or when every entry is stale).
+        """
+        upcoming = self._upcoming.get(job_id)
+        while upcoming and upcoming[0] <= now:
+            upcoming.popleft()
+        if not upcoming:
             try:
-                now = datetime.now()
-                with self._lock:
-                    for job_id, job in list(self._jobs.items()):
-                        if not job.get("enabled", True):
-                            continue
-                        next_run_str = job.get("next_run")
-                        if not next_run_str:
-                            continue
-                        try:
-                            next_run = datetime.fromisoformat(next_run_str)
-                        except ValueError:
-                            continue
-                        if now >= next_run:
-                            print(f"[SCHEDULER] Triggering job: {job_id} ({job['name']})")
-                            run_id = str(uuid.uuid4())[:8]
-                            config = {
-                                "target_url": job["target_url"],
-                                "categories": job.get("categories", ["all"]),
-                                "scenarios": job.get("scenarios", []),
-                                "timeout": job.get("timeout", 30),
-                            }
-                            t = threading.Thread(
-                                target=self._execute_run,
-                                args=(run_id, config, job_id),
-                                daemon=True,
-                            )
-                            t.start()
-                            try:
-                                cron_obj = CronExpression(job["cron"])
-                                next_next = cron_obj.next_run(after=now)
-                                job["next_run"] = next_next.isoformat() if next_next else None
-                            except ValueError:
-                                job["next_run"] = None
-                            self._save_jobs()
+                cron_obj = CronExpression(job["cron"])
+            except ValueError:
+                return None
+            upcoming = deque(cron_obj.next_runs(after=now, count=_RUN_HORIZON))
+            self._upcoming[job_id] = upcoming
+        return upcoming.popleft() if upcoming else None
+
+    def _run_due_jobs(self):
+        """Trigger every job whose heap entry is due. Caller holds the lock."""
+        now_ts = time.time()
+        now = datetime.now()
+        while self._heap and self._heap[0][0] <= now_ts:
+            _, job_id, next_run_str = heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if not job or not job.get("enabled", True) or job.get("next_run") != next_run_str:
+                continue
+            # Work out the following run before firing, so a failure here
+            # keeps the job queued (retried shortly) instead of dropping it.
+            try:
+                next_next = self._pop_upcoming(job_id, job, now)
             except Exception as e:
-                print(f"[SCHEDULER] Loop error: {e}")
-            for _ in range(30):
-                if not self._running:
-                    return
-                time.sleep(1)
+                print(f"[SCHEDULER] Next run for {job_id} failed: {e}")
+                heapq.heappush(self._heap, (now_ts + _MAX_WAIT_SECONDS, job_id, next_run_str))
+                continue
+            print(f"[SCHEDULER] Triggering job: {job_id} ({job['name']})")
+            run_id = str(uuid.uuid4())[:8]
+            config = {
+                "target_url": job["target_url"],
+                "categories": job.get("categories", ["all"]),
+                "scenarios": job.get("scenarios", []),
+                "timeout": job.get("timeout", 30),
+            }
+            t = threading.Thread(
+                target=self._execute_run,
+                args=(run_id, config, job_id),
+                daemon=True,
+            )
+            t.start()
+            self._set_next_run(job_id, job, next_next)
+
+    def _scheduler_loop(self):
+        """Sleep until the earliest queued job is due instead of polling.
+
+        Mutations notify ``self._wakeup``, so a newly scheduled job that is
+        due sooner than the current head wakes the loop immediately.
+        """
+        with self._wakeup:
+            while self._running:
+                try:
+                    self._run_due_jobs()
+                except Exception as e:
+                    print(f"[SCHEDULER] Loop error: {e}")
+                timeout = _MAX_WAIT_SECONDS
+                if self._heap:
+                    timeout = min(max(self._heap[0][0] - time.time(), 0), timeout)
+                self._wakeup.wait(timeout)
 
 
 _scheduler = None
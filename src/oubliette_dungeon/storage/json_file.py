@@ -1,6 +1,12 @@
 """
 JSON-based storage for red team test results.
 
+Session files are newline-delimited JSON: a header line carrying the
+session metadata followed by one ``{"saved_at": ..., "result": ...}`` line
+per saved result, so saving a result is a single append. Session files in
+the older single-document layout are still read, and are rewritten in the
+new layout the next time a result is saved to them.
+
 Features:
 - Save and load test results
 - Query by session, category, difficulty, result type
@@ -8,17 +14,29 @@ Features:
 - Export to various formats (JSON, CSV)
 """
 
+import atexit
+import copy
 import csv
 import json
+import mmap
 import os
 import re
 import stat
 import sys
 import threading
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: pip install oubliette-dungeon[fast]
+    orjson = None
+
 _SAFE_SESSION_ID = re.compile(r"^[a-zA-Z0-9_\-]{1,128}$")
 
 # Serialize the read-modify-write cycle in save_result per session id so
@@ -32,6 +50,35 @@ _SESSION_LOCKS: dict[str, threading.Lock] = {}
 # Serializes mutation + persistence of the shared session index.
 _INDEX_GUARD = threading.Lock()
 
+# save_result marks the index dirty and a timer writes it this long after,
+# so a burst of saves costs one index rewrite instead of one per result.
+_INDEX_FLUSH_DELAY_SECONDS = 0.5
+
+# Databases with an index write still pending; flushed at interpreter exit.
+_DIRTY_DBS: "weakref.WeakSet[RedTeamResultsDB]" = weakref.WeakSet()
+
+
+def _flush_dirty_dbs() -> None:
+    for db in list(_DIRTY_DBS):
+        db.flush()
+
+
+atexit.register(_flush_dirty_dbs)
+
+_EXPORT_BUFFER_BYTES = 1 << 20
+
+_MMAP_THRESHOLD_BYTES = 256 * 1024
+
+# Upper bound on threads used to read several session files at once.
+_MAX_READ_WORKERS = 8
+
+# Parsed sessions kept in memory per DB; the API shares one long-lived DB,
+# so this must not grow with the size of the results store.
+_TAIL_CACHE_SESSIONS = 4
+
+# Rendered markdown reports kept per DB, least recently used evicted first.
+_REPORT_CACHE_SIZE = 64
+
 
 def _session_lock(session_id: str) -> threading.Lock:
     with _SESSION_LOCKS_GUARD:
@@ -42,21 +89,155 @@ def _session_lock(session_id: str) -> threading.Lock:
         return lock
 
 
+class _LRUCache:
+    """Small thread-safe mapping that evicts the least recently used key."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, via orjson when it is installed.
+
+    Falls back to the stdlib for values orjson rejects (e.g. integers
+    wider than 64 bits) so the optional dependency never changes what can
+    be stored.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _atomic_write_json(path: Path, data: Any) -> None:
     """Write JSON to ``path`` via a temp file + atomic rename.
 
     Prevents torn/partial files if the process dies mid-write and prevents a
     concurrent reader from observing a half-written document.
     """
+    _atomic_write_bytes(path, _dumps(data, indent=True))
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file + atomic rename."""
     tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
-    with open(tmp, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(data)
         f.flush()
         os.fsync(f.fileno())
     _restrict_permissions(tmp)
     os.replace(tmp, path)
 
 
+def _ndjson_line(record: Any) -> bytes:
+    return _dumps(record) + b"\n"
+
+
+def _drop_torn_line(f) -> None:
+    """Truncate a partial last line left by a crash mid-append.
+
+    ``f`` is the session file opened ``a+b``. Without this the next append
+    would be glued onto the fragment and both would be skipped as invalid
+    JSON. The header line is written atomically, so a newline always exists.
+    """
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    pos = end
+    while pos > 0:
+        start = max(pos - _EXPORT_BUFFER_BYTES, 0)
+        f.seek(start)
+        newline = f.read(pos - start).rfind(b"\n")
+        if newline != -1:
+            f.truncate(start + newline + 1)
+            return
+        pos = start
+    f.truncate(0)
+
+
+def _parse_header(line: bytes) -> dict[str, Any] | None:
+    """Return the NDJSON header record, or None for a legacy session file."""
+    try:
+        header = _loads(line)
+    except ValueError:
+        return None
+    if not isinstance(header, dict) or "results" in header or "session_id" not in header:
+        return None
+    return header
+
+
+@dataclass
+class _SessionTail:
+    """Parsed contents of one session file plus per-field lookup indexes.
+
+    The ``by_*`` dicts map a field value to the positions of the matching
+    records in ``results`` so the query_by_* helpers don't rescan the
+    session. Difficulty keys are lowercased to match the case-insensitive
+    query.
+    """
+
+    header_line: bytes
+    header: dict[str, Any]
+    updated_at: str
+    offset: int = 0
+    results: list[dict[str, Any]] = field(default_factory=list)
+    by_category: dict[str, list[int]] = field(default_factory=dict)
+    by_result: dict[str, list[int]] = field(default_factory=dict)
+    by_difficulty: dict[str, list[int]] = field(default_factory=dict)
+
+    def add(self, record: dict[str, Any]) -> None:
+        position = len(self.results)
+        self.results.append(record)
+        if not isinstance(record, dict):
+            return
+        difficulty = record.get("difficulty")
+        for index, key in (
+            (self.by_category, record.get("category")),
+            (self.by_result, record.get("result")),
+            (self.by_difficulty, difficulty.lower() if isinstance(difficulty, str) else None),
+        ):
+            if isinstance(key, str):
+                index.setdefault(key, []).append(position)
+
+    def select(self, index: dict[str, list[int]], key: str) -> list[dict[str, Any]]:
+        return copy.deepcopy([self.results[i] for i in index.get(key, ())])
+
+
 def is_valid_session_id(session_id: str) -> bool:
     """Canonical session_id validator shared by storage and HTTP routes.
 
@@ -93,20 +274,51 @@ class RedTeamResultsDB:
         self.db_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.db_dir / "index.json"
         self.index = self._load_index()
+        self._index_dirty = False
+        self._index_timer: threading.Timer | None = None
+        # What has been parsed of recently used session files, so re-reading
+        # a session only decodes the lines appended since.
+        self._tail_cache = _LRUCache(_TAIL_CACHE_SESSIONS)
+        # session_id -> ((updated_at, total_tests), rendered markdown report)
+        self._report_cache = _LRUCache(_REPORT_CACHE_SIZE)
 
     def _load_index(self) -> dict[str, Any]:
         if self.index_file.exists():
-            with open(self.index_file) as f:
-                return json.load(f)
+            with open(self.index_file, "rb") as f:
+                return _loads(f.read())
         default = {"sessions": {}}
-        with open(self.index_file, "w") as f:
-            json.dump(default, f, indent=2)
+        with open(self.index_file, "wb") as f:
+            f.write(_dumps(default, indent=True))
         _restrict_permissions(self.index_file)
         return default
 
     def _save_index(self) -> None:
         _atomic_write_json(self.index_file, self.index)
 
+    def _mark_index_dirty(self) -> None:
+        """Schedule a coalesced index write. Caller holds ``_INDEX_GUARD``."""
+        self._index_dirty = True
+        _DIRTY_DBS.add(self)
+        if self._index_timer is None:
+            self._index_timer = threading.Timer(_INDEX_FLUSH_DELAY_SECONDS, self.flush)
+            self._index_timer.daemon = True
+            self._index_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending index update to disk now."""
+        with _INDEX_GUARD:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """``flush`` body. Caller holds ``_INDEX_GUARD``."""
+        if self._index_timer is not None:
+            self._index_timer.cancel()
+            self._index_timer = None
+        if self._index_dirty:
+            self._save_index()
+            self._index_dirty = False
+        _DIRTY_DBS.discard(self)
+
     def save_result(
         self,
         result,
@@ -131,47 +343,174 @@ class RedTeamResultsDB:
 
         session_file = self.db_dir / f"{session_id}.json"
 
-        # HIGH fix (2026-07-02 review): serialize the read-modify-write per
-        # session id and write atomically. Concurrent writers previously read
-        # the same stale document, each appended one result, and the last
-        # writer clobbered the others -- silently dropping results.
+        # HIGH fix (2026-07-02 review): serialize writers per session id so
+        # concurrent saves cannot interleave. Each result is one appended
+        # line; only a torn fragment from a crashed append is ever trimmed.
         with _session_lock(session_id):
-            if session_file.exists():
-                with open(session_file) as f:
-                    session_data = json.load(f)
-            else:
-                session_data = {
-                    "session_id": session_id,
-                    "started_at": datetime.now().isoformat(),
-                    "results": [],
-                    "created_by_key_hint": caller_key_hint or "__anon__",
-                }
-
-            # Only stamp the hint on first write; never overwrite a prior value.
-            session_data.setdefault("created_by_key_hint", caller_key_hint or "__anon__")
-
-            session_data["results"].append(result_dict)
-            session_data["updated_at"] = datetime.now().isoformat()
-            session_data["total_tests"] = len(session_data["results"])
-
-            _atomic_write_json(session_file, session_data)
+            self._ensure_ndjson_session(session_file, session_id, caller_key_hint)
+            updated_at = datetime.now().isoformat()
+            with open(session_file, "a+b") as f:
+                _drop_torn_line(f)
+                f.write(_ndjson_line({"saved_at": updated_at, "result": result_dict}))
+                f.flush()
+                os.fsync(f.fileno())
+
+            tail = self._load_tail(session_id, session_file)
 
             with _INDEX_GUARD:
                 if session_id not in self.index["sessions"]:
                     self.index["sessions"][session_id] = {
                         "file": str(session_file),
-                        "started_at": session_data["started_at"],
+                        "started_at": tail.header["started_at"],
                         "total_tests": 0,
-                        "created_by_key_hint": session_data["created_by_key_hint"],
+                        "created_by_key_hint": tail.header["created_by_key_hint"],
                     }
 
-                self.index["sessions"][session_id]["updated_at"] = session_data["updated_at"]
-                self.index["sessions"][session_id]["total_tests"] = session_data["total_tests"]
+                self.index["sessions"][session_id]["updated_at"] = tail.updated_at
+                self.index["sessions"][session_id]["total_tests"] = len(tail.results)
                 # Backfill the hint on the index for records that pre-date MED-11.
                 self.index["sessions"][session_id].setdefault(
-                    "created_by_key_hint", session_data["created_by_key_hint"]
+                    "created_by_key_hint", tail.header["created_by_key_hint"]
                 )
-                self._save_index()
+                self._mark_index_dirty()
+
+    def _ensure_ndjson_session(
+        self, session_file: Path, session_id: str, caller_key_hint: str | None
+    ) -> None:
+        """Create the session file, or convert a legacy one, before appending.
+
+        Caller holds the session lock. The key hint is only stamped on first
+        write; a prior value is never overwritten.
+        """
+        if not session_file.exists():
+            header = {
+                "session_id": session_id,
+                "started_at": datetime.now().isoformat(),
+                "created_by_key_hint": caller_key_hint or "__anon__",
+            }
+            _atomic_write_bytes(session_file, _ndjson_line(header))
+            return
+
+        with open(session_file, "rb") as f:
+            if _parse_header(f.readline()) is not None:
+                return
+            f.seek(0)
+            legacy = _loads(f.read())
+
+        header = {
+            "session_id": legacy.get("session_id", session_id),
+            "started_at": legacy.get("started_at") or datetime.now().isoformat(),
+            "created_by_key_hint": legacy.get("created_by_key_hint", caller_key_hint or "__anon__"),
+        }
+        saved_at = legacy.get("updated_at", header["started_at"])
+        lines = [_ndjson_line(header)]
+        lines.extend(
+            _ndjson_line({"saved_at": saved_at, "result": r}) for r in legacy.get("results", [])
+        )
+        _atomic_write_bytes(session_file, b"".join(lines))
+        self._tail_cache.pop(session_id)
+
+    def _load_tail(self, session_id: str, session_file: Path) -> _SessionTail | None:
+        """Parse whatever the session file gained since it was last read.
+
+        Returns None for a missing or legacy-format file. A cached entry is
+        only reused while the file's header line is unchanged, so a deleted
+        and recreated session is read from scratch. Only complete lines are
+        consumed, so a concurrent or torn append is picked up on a later
+        read.
+
+        Caller holds the session lock: new records are added to the cached
+        entry in place, so saving a result never copies the results that
+        came before it.
+        """
+        try:
+            with open(session_file, "rb") as f:
+                header_line = f.readline()
+                tail = self._tail_cache.get(session_id)
+                if tail is None or tail.header_line != header_line:
+                    header = _parse_header(header_line)
+                    if header is None:
+                        return None
+                    tail = _SessionTail(header_line, header, header["started_at"], len(header_line))
+                # Large unread regions (a big session on first read) are
+                # mapped rather than read, so the raw bytes are never copied
+                # into one buffer alongside the decoded records.
+                if os.fstat(f.fileno()).st_size - tail.offset > _MMAP_THRESHOLD_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        tail.offset += self._consume_lines(tail, buf, tail.offset)
+                else:
+                    f.seek(tail.offset)
+                    tail.offset += self._consume_lines(tail, f.read(), 0)
+        except FileNotFoundError:
+            return None
+
+        self._tail_cache.put(session_id, tail)
+        return tail
+
+    @staticmethod
+    def _consume_lines(tail: _SessionTail, buf, start: int) -> int:
+        """Add every complete result line in ``buf[start:]`` to ``tail``.
+
+        Returns the number of bytes consumed; a trailing partial line is
+        left for a later read.
+        """
+        end = buf.rfind(b"\n", start) + 1
+        pos = start
+        while pos < end:
+            newline = buf.find(b"\n", pos)
+            line = buf[pos:newline]
+            pos = newline + 1
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue
+            tail.add(record["result"])
+            tail.updated_at = record["saved_at"]
+        return max(end - start, 0)
+
+    def _read_session(self, session_id: str) -> _SessionTail | None:
+        """Current contents of a session, or None if it does not exist.
+
+        Legacy single-document files are parsed into a transient entry so
+        callers see one shape either way.
+        """
+        _validate_session_id(session_id)
+        session_file = self.db_dir / f"{session_id}.json"
+        if not session_file.exists():
+            return None
+        with _session_lock(session_id):
+            tail = self._load_tail(session_id, session_file)
+        if tail is not None:
+            return tail
+        with open(session_file, "rb") as f:
+            legacy = _loads(f.read())
+        results = legacy.pop("results", [])
+        updated_at = legacy.pop("updated_at", None)
+        legacy.pop("total_tests", None)
+        tail = _SessionTail(b"", legacy, updated_at)
+        for record in results:
+            tail.add(record)
+        return tail
+
+    def _iter_results(self, session_id: str):
+        """Yield a session's results straight from disk, bypassing the cache."""
+        with open(self.db_dir / f"{session_id}.json", "rb") as f:
+            if _parse_header(f.readline()) is None:
+                f.seek(0)
+                yield from _loads(f.read()).get("results", [])
+                return
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    continue
+                yield record["result"]
+
+    def _latest_session_id(self) -> str | None:
+        sessions = self.list_sessions()
+        return sessions[0]["session_id"] if sessions else None
 
     # ------------------------------------------------------------------
     # Read helpers -- accept an optional caller_key_hint for scoping.
@@ -185,164 +524,246 @@ class RedTeamResultsDB:
             return True
         return session_data.get("created_by_key_hint") == caller_key_hint
 
-    def get_session(self, session_id: str, caller_key_hint: str | None = None) -> dict | None:
+    def get_session(
+        self,
+        session_id: str,
+        caller_key_hint: str | None = None,
+        include_results: bool = True,
+    ) -> dict | None:
+        """Return a session document, or None if missing or not the caller's.
+
+        ``include_results=False`` returns only the metadata (header fields,
+        ``updated_at`` and ``total_tests``). For a session that has not been
+        read yet that costs one header decode and a newline count instead
+        of decoding every result.
+        """
+        if not include_results:
+            meta = self._read_session_meta(session_id)
+            if meta is None or not self._owned_by(meta, caller_key_hint):
+                return None
+            return meta
+        tail = self._read_session(session_id)
+        if tail is None or not self._owned_by(tail.header, caller_key_hint):
+            return None
+        # Deep copy: nested lists/dicts would otherwise alias the cache.
+        session_data = {**tail.header, "results": copy.deepcopy(list(tail.results))}
+        if tail.updated_at is not None:
+            session_data["updated_at"] = tail.updated_at
+        session_data["total_tests"] = len(tail.results)
+        return session_data
+
+    def get_sessions(
+        self, session_ids, caller_key_hint: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """``get_session`` for several sessions, keyed by session id.
+
+        Session files are independent, so files not yet in the tail cache
+        are read on a small thread pool; the blocking reads overlap even
+        though decoding still takes the GIL. Missing or foreign sessions are
+        left out.
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        if len(session_ids) <= 1:
+            docs = [self.get_session(sid, caller_key_hint) for sid in session_ids]
+        else:
+            workers = min(_MAX_READ_WORKERS, len(session_ids))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                docs = list(
+                    pool.map(lambda sid: self.get_session(sid, caller_key_hint), session_ids)
+                )
+        return {sid: doc for sid, doc in zip(session_ids, docs, strict=True) if doc is not None}
+
+    def _read_session_meta(self, session_id: str) -> dict[str, Any] | None:
         _validate_session_id(session_id)
         session_file = self.db_dir / f"{session_id}.json"
-        if not session_file.exists():
+        if session_id not in self._tail_cache and session_file.exists():
+            with open(session_file, "rb") as f:
+                header = _parse_header(f.readline())
+                if header is not None:
+                    body = f.read()
+                    body = body[: body.rfind(b"\n") + 1]
+                    updated_at = header["started_at"]
+                    last = body[body.rfind(b"\n", 0, -1) + 1 :]
+                    if last:
+                        try:
+                            updated_at = _loads(last)["saved_at"]
+                        except ValueError:
+                            pass
+                    return {**header, "updated_at": updated_at, "total_tests": body.count(b"\n")}
+        tail = self._read_session(session_id)
+        if tail is None:
             return None
-        with open(session_file) as f:
-            session_data = json.load(f)
-        if not self._owned_by(session_data, caller_key_hint):
-            return None
-        return session_data
+        meta = dict(tail.header)
+        if tail.updated_at is not None:
+            meta["updated_at"] = tail.updated_at
+        meta["total_tests"] = len(tail.results)
+        return meta
 
     def list_sessions(self, caller_key_hint: str | None = None) -> list[dict[str, Any]]:
         sessions = []
-        for session_id, meta in self.index["sessions"].items():
+        with _INDEX_GUARD:
+            entries = list(self.index["sessions"].items())
+        for session_id, meta in entries:
             if caller_key_hint is not None and meta.get("created_by_key_hint") != caller_key_hint:
                 continue
             sessions.append({"session_id": session_id, **meta})
         return sorted(sessions, key=lambda x: x["started_at"], reverse=True)
 
-    def get_latest_session(self, caller_key_hint: str | None = None) -> dict | None:
+    def get_latest_session(
+        self, caller_key_hint: str | None = None, include_results: bool = True
+    ) -> dict | None:
         sessions = self.list_sessions(caller_key_hint=caller_key_hint)
         if sessions:
-            return self.get_session(sessions[0]["session_id"], caller_key_hint=caller_key_hint)
+            return self.get_session(
+                sessions[0]["session_id"],
+                caller_key_hint=caller_key_hint,
+                include_results=include_results,
+            )
         return None
 
+    def _query(self, index_name: str, key: str, session_id: str | None) -> list[dict[str, Any]]:
+        session_id = session_id or self._latest_session_id()
+        tail = self._read_session(session_id) if session_id else None
+        if tail is None:
+            return []
+        return tail.select(getattr(tail, index_name), key)
+
     def query_by_category(
         self, category: str, session_id: str | None = None
     ) -> list[dict[str, Any]]:
-        session_data = self.get_session(session_id) if session_id else self.get_latest_session()
-        if not session_data:
-            return []
-        return [r for r in session_data["results"] if r["category"] == category]
+        return self._query("by_category", category, session_id)
 
     def query_by_result(
         self, result_type: str, session_id: str | None = None
     ) -> list[dict[str, Any]]:
-        session_data = self.get_session(session_id) if session_id else self.get_latest_session()
-        if not session_data:
-            return []
-        return [r for r in session_data["results"] if r["result"] == result_type]
+        return self._query("by_result", result_type, session_id)
 
     def query_by_difficulty(
         self, difficulty: str, session_id: str | None = None
     ) -> list[dict[str, Any]]:
-        session_data = self.get_session(session_id) if session_id else self.get_latest_session()
-        if not session_data:
-            return []
-        return [r for r in session_data["results"] if r["difficulty"].lower() == difficulty.lower()]
+        return self._query("by_difficulty", difficulty.lower(), session_id)
 
     def get_statistics(self, session_id: str | None = None) -> dict[str, Any]:
-        session_data = self.get_session(session_id) if session_id else self.get_latest_session()
-        if not session_data or not session_data["results"]:
+        session_id = session_id or self._latest_session_id()
+        tail = self._read_session(session_id) if session_id else None
+        if tail is None or not tail.results:
             return {"error": "No results found"}
 
-        results = session_data["results"]
-
-        stats = {
-            "session_id": session_data["session_id"],
-            "total_tests": len(results),
-            "started_at": session_data["started_at"],
-            "updated_at": session_data.get("updated_at", ""),
-            "by_result": {},
-            "by_category": {},
-            "by_difficulty": {},
-            "avg_execution_time_ms": 0,
-            "avg_confidence": 0,
-            "detection_rate": 0,
-            "bypass_rate": 0,
-            "high_confidence_tests": 0,
-        }
-
+        # Snapshot: a concurrent save may append to the cached list.
+        results = list(tail.results)
+        by_result: Counter[str] = Counter()
+        by_category: Counter[str] = Counter()
+        by_difficulty: Counter[str] = Counter()
         total_time = 0
         total_confidence = 0
-        detected = 0
-        bypassed = 0
         high_conf = 0
 
         for result in results:
-            result_type = result["result"]
-            stats["by_result"][result_type] = stats["by_result"].get(result_type, 0) + 1
-            category = result["category"]
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-            difficulty = result["difficulty"]
-            stats["by_difficulty"][difficulty] = stats["by_difficulty"].get(difficulty, 0) + 1
-
+            by_result[result["result"]] += 1
+            by_category[result["category"]] += 1
+            by_difficulty[result["difficulty"]] += 1
             total_time += result.get("execution_time_ms", 0)
-            total_confidence += result.get("confidence", 0)
-
-            if result_type == "detected":
-                detected += 1
-            elif result_type == "bypass":
-                bypassed += 1
-
-            if result.get("confidence", 0) >= 0.85:
-                high_conf += 1
-
-        stats["avg_execution_time_ms"] = total_time / len(results)
-        stats["avg_confidence"] = total_confidence / len(results)
-        stats["detection_rate"] = (detected / len(results)) * 100
-        stats["bypass_rate"] = (bypassed / len(results)) * 100
-        stats["high_confidence_tests"] = high_conf
-
-        return stats
+            confidence = result.get("confidence", 0)
+            total_confidence += confidence
+            high_conf += confidence >= 0.85
+
+        n = len(results)
+        return {
+            "session_id": tail.header["session_id"],
+            "total_tests": n,
+            "started_at": tail.header["started_at"],
+            "updated_at": tail.updated_at or "",
+            "by_result": dict(by_result),
+            "by_category": dict(by_category),
+            "by_difficulty": dict(by_difficulty),
+            "avg_execution_time_ms": total_time / n,
+            "avg_confidence": total_confidence / n,
+            "detection_rate": by_result["detected"] / n * 100,
+            "bypass_rate": by_result["bypass"] / n * 100,
+            "high_confidence_tests": high_conf,
+        }
 
     def export_to_csv(self, output_file: str, session_id: str | None = None) -> None:
-        session_data = self.get_session(session_id) if session_id else self.get_latest_session()
-        if not session_data:
+        """Export a session's results as CSV, one row per result.
+
+        Rows are streamed from the session file rather than loaded into
+        memory first, so peak memory stays at one record however large the
+        session is. Columns come from the first result.
+        """
+        session_id = session_id or self._latest_session_id()
+        if session_id:
+            _validate_session_id(session_id)
+        if not session_id or not (self.db_dir / f"{session_id}.json").exists():
             print("No results to export")
             return
-        results = session_data["results"]
-        with open(output_file, "w", newline="", encoding="utf-8") as f:
-            if results:
-                writer = csv.DictWriter(f, fieldnames=results[0].keys())
-                writer.writeheader()
-                writer.writerows(results)
-        print(f"Exported {len(results)} results to {output_file}")
+        count = 0
+        with open(
+            output_file, "w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_BYTES
+        ) as f:
+            writer = None
+            for record in self._iter_results(session_id):
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=record.keys())
+                    writer.writeheader()
+                writer.writerow(record)
+                count += 1
+        print(f"Exported {count} results to {output_file}")
 
     def export_to_json(self, output_file: str, session_id: str | None = None) -> None:
         session_data = self.get_session(session_id) if session_id else self.get_latest_session()
         if not session_data:
             print("No results to export")
             return
-        with open(output_file, "w") as f:
-            json.dump(session_data, f, indent=2)
+        with open(output_file, "wb") as f:
+            f.write(_dumps(session_data, indent=True))
         print(f"Exported session to {output_file}")
 
     def generate_report(self, session_id: str | None = None) -> str:
+        """Render the markdown report for a session (latest by default).
+
+        Reports are cached per session and reused until a result is saved
+        to it, which changes its ``updated_at`` and result count.
+        """
+        session_id = session_id or self._latest_session_id()
+        tail = self._read_session(session_id) if session_id else None
+        if tail is None:
+            return self._render_report(session_id)
+        key = (tail.updated_at, len(tail.results))
+        cached = self._report_cache.get(session_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        report = self._render_report(session_id)
+        self._report_cache.put(session_id, (key, report))
+        return report
+
+    def _render_report(self, session_id: str | None) -> str:
         stats = self.get_statistics(session_id)
         if "error" in stats:
             return f"# Error\n\n{stats['error']}"
 
-        report = []
-        report.append("# Red Team Test Report")
-        report.append(f"\n**Session ID**: {stats['session_id']}")
-        report.append(f"**Started**: {stats['started_at']}")
-        report.append(f"**Completed**: {stats.get('updated_at', 'In progress')}")
-        report.append("\n## Summary\n")
-        report.append(f"- **Total Tests**: {stats['total_tests']}")
-        report.append(f"- **Detection Rate**: {stats['detection_rate']:.1f}%")
-        report.append(f"- **Bypass Rate**: {stats['bypass_rate']:.1f}%")
-        report.append(f"- **Average Confidence**: {stats['avg_confidence']:.2%}")
-        report.append(f"- **Average Execution Time**: {stats['avg_execution_time_ms']:.2f}ms")
-        report.append(f"- **High Confidence Tests**: {stats['high_confidence_tests']}")
-
-        report.append("\n## Results by Type\n")
-        for result_type, count in stats["by_result"].items():
-            percentage = (count / stats["total_tests"]) * 100
-            report.append(f"- **{result_type}**: {count} ({percentage:.1f}%)")
-
-        report.append("\n## Results by Category\n")
-        for category, count in sorted(stats["by_category"].items()):
-            percentage = (count / stats["total_tests"]) * 100
-            report.append(f"- **{category}**: {count} ({percentage:.1f}%)")
-
-        report.append("\n## Results by Difficulty\n")
-        for difficulty, count in sorted(stats["by_difficulty"].items()):
-            percentage = (count / stats["total_tests"]) * 100
-            report.append(f"- **{difficulty}**: {count} ({percentage:.1f}%)")
+        total = stats["total_tests"]
+        report = [
+            "# Red Team Test Report",
+            f"\n**Session ID**: {stats['session_id']}",
+            f"**Started**: {stats['started_at']}",
+            f"**Completed**: {stats.get('updated_at', 'In progress')}",
+            "\n## Summary\n",
+            f"- **Total Tests**: {total}",
+            f"- **Detection Rate**: {stats['detection_rate']:.1f}%",
+            f"- **Bypass Rate**: {stats['bypass_rate']:.1f}%",
+            f"- **Average Confidence**: {stats['avg_confidence']:.2%}",
+            f"- **Average Execution Time**: {stats['avg_execution_time_ms']:.2f}ms",
+            f"- **High Confidence Tests**: {stats['high_confidence_tests']}",
+        ]
+        for title, counts in (
+            ("Type", stats["by_result"].items()),
+            ("Category", sorted(stats["by_category"].items())),
+            ("Difficulty", sorted(stats["by_difficulty"].items())),
+        ):
+            report.append(f"\n## Results by {title}\n")
+            report.extend(
+                f"- **{key}**: {count} ({count / total * 100:.1f}%)" for key, count in counts
+            )
 
         return "\n".join(report)
 
@@ -357,9 +778,15 @@ class RedTeamResultsDB:
         session_file = self.db_dir / f"{session_id}.json"
         if session_file.exists():
             session_file.unlink()
-            if session_id in self.index["sessions"]:
-                del self.index["sessions"][session_id]
-                self._save_index()
+            self._tail_cache.pop(session_id)
+            self._report_cache.pop(session_id)
+            # Under the guard so the coalescing timer never serializes the
+            # index mid-delete; the write also covers any pending update.
+            with _INDEX_GUARD:
+                if session_id in self.index["sessions"]:
+                    del self.index["sessions"][session_id]
+                    self._index_dirty = True
+                self._flush_locked()
             print(f"Deleted session: {session_id}")
             return True
         print(f"Session not found: {session_id}")
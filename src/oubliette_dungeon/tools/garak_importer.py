@@ -18,6 +18,7 @@ from pathlib import Path
 
 import yaml
 
+from oubliette_dungeon.core.loader import YamlSafeLoader
 from oubliette_dungeon.core.models import AttackScenario
 
 # ---------------------------------------------------------------------------
@@ -61,6 +62,46 @@ CATEGORY_OWASP: dict[str, list[str]] = {
     "compliance_testing": ["LLM06", "LLM09"],
 }
 
+# Assignment targets whose list values are treated as probe prompts
+_PROMPT_ATTR_NAMES = frozenset(
+    (
+        "prompts",
+        "attempts",
+        "payloads",
+        "triggers",
+        "prompt_list",
+        "attack_prompts",
+        "prefixes",
+    )
+)
+
+# Regex fallback: compiled once rather than per probe file
+_TRIPLE_QUOTED_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+_QUOTED_STRING_RE = re.compile(r'"([^"]{20,500})"')
+
+_TRIPLE_QUOTED_KEYWORDS = (
+    "ignore",
+    "pretend",
+    "forget",
+    "bypass",
+    "system",
+    "instructions",
+    "override",
+    "admin",
+    "jailbreak",
+)
+_QUOTED_STRING_KEYWORDS = (
+    "ignore",
+    "pretend",
+    "forget",
+    "bypass",
+    "system",
+    "override",
+    "admin",
+    "jailbreak",
+    "prompt",
+)
+
 
 # ---------------------------------------------------------------------------
 # GarakImporter
@@ -175,7 +216,7 @@ class GarakImporter:
 
         if os.path.exists(existing_yaml_path):
             with open(existing_yaml_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or []
+                data = yaml.load(f, Loader=YamlSafeLoader) or []
             if isinstance(data, dict) and "scenarios" in data:
                 data = data["scenarios"]
             for s in data:
@@ -280,15 +321,7 @@ class GarakImporter:
                         elif isinstance(target, ast.Attribute):
                             attr_name = target.attr
 
-                        if attr_name.lower() in (
-                            "prompts",
-                            "attempts",
-                            "payloads",
-                            "triggers",
-                            "prompt_list",
-                            "attack_prompts",
-                            "prefixes",
-                        ):
+                        if attr_name.lower() in _PROMPT_ATTR_NAMES:
                             strings = GarakImporter._extract_strings_from_node(node.value)
                             prompts.extend(strings)
         except SyntaxError:
@@ -297,41 +330,17 @@ class GarakImporter:
         # --- Regex fallback -------------------------------------------------
         if not prompts:
             # Find triple-quoted strings that look like prompts
-            for match in re.finditer(r'"""(.*?)"""', source, re.DOTALL):
+            for match in _TRIPLE_QUOTED_RE.finditer(source):
                 text = match.group(1).strip()
-                if len(text) > 20 and any(
-                    k in text.lower()
-                    for k in (
-                        "ignore",
-                        "pretend",
-                        "forget",
-                        "bypass",
-                        "system",
-                        "instructions",
-                        "override",
-                        "admin",
-                        "jailbreak",
-                    )
-                ):
+                lowered = text.lower()
+                if len(text) > 20 and any(k in lowered for k in _TRIPLE_QUOTED_KEYWORDS):
                     prompts.append(text)
 
             # Find single-quoted strings in lists
-            for match in re.finditer(r'"([^"]{20,500})"', source):
+            for match in _QUOTED_STRING_RE.finditer(source):
                 text = match.group(1).strip()
-                if any(
-                    k in text.lower()
-                    for k in (
-                        "ignore",
-                        "pretend",
-                        "forget",
-                        "bypass",
-                        "system",
-                        "override",
-                        "admin",
-                        "jailbreak",
-                        "prompt",
-                    )
-                ):
+                lowered = text.lower()
+                if any(k in lowered for k in _QUOTED_STRING_KEYWORDS):
                     prompts.append(text)
 
         # De-duplicate and cap
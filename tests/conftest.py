@@ -2,7 +2,10 @@
 Shared test fixtures for oubliette-dungeon.
 """
 
+import atexit
 import os
+import shutil
+import tempfile
 
 # Tests intentionally use localhost / private targets; opt in to the
 # "private targets allowed" flag so SSRF validators do not block them.
@@ -17,10 +20,23 @@ os.environ.setdefault("DUNGEON_ALLOW_PRIVATE_TARGETS", "true")
 # surfaces to anyone who imports ScenarioLoader outside the test suite.
 os.environ.setdefault("DUNGEON_ALLOW_CUSTOM_SCENARIOS", "true")
 
+# API tests that don't override RESULTS_DB_DIR fall back to the process-wide
+# results DB. Point it at a per-process temp dir so pytest-xdist workers never
+# share (or race on) ./redteam_results/index.json and runs leave no litter.
+# It must be set before oubliette_dungeon is imported, so this runs at conftest
+# import and is removed at interpreter exit; an explicit setting is left alone.
+if "DUNGEON_DB_DIR" not in os.environ:
+    _TEST_DB_DIR = tempfile.mkdtemp(prefix="dungeon-test-db-")
+    os.environ["DUNGEON_DB_DIR"] = _TEST_DB_DIR
+    atexit.register(shutil.rmtree, _TEST_DB_DIR, ignore_errors=True)
+
+import json
 from datetime import datetime
 
 import pytest
+import requests
 import yaml
+from requests.adapters import BaseAdapter
 
 from oubliette_dungeon.core import (
     AttackResult,
@@ -31,9 +47,7 @@ from oubliette_dungeon.core import (
 )
 
 
-@pytest.fixture
-def sample_scenario_data():
-    """Sample YAML scenario data for testing"""
+def _sample_scenario_data():
     return [
         {
             "id": "ATK-001",
@@ -62,6 +76,12 @@ def sample_scenario_data():
     ]
 
 
+@pytest.fixture
+def sample_scenario_data():
+    """Sample YAML scenario data for testing"""
+    return _sample_scenario_data()
+
+
 @pytest.fixture
 def sample_scenario():
     """Sample AttackScenario object"""
@@ -97,13 +117,90 @@ def multi_turn_scenario():
     )
 
 
+@pytest.fixture(scope="session")
+def long_safe_response():
+    """~150 KB benign response, built once per session"""
+    return "Safe response. " * 10000
+
+
+@pytest.fixture(scope="session")
+def multi_turn_bypass_response():
+    """Combined multi-turn transcript whose final turn leaks a secret"""
+    return "\n---TURN---\n".join(
+        ["I'll help you with that.", "Here's some information.", "The secret is: test123"]
+    )
+
+
+def _write_yaml(data, yaml_file):
+    with open(yaml_file, "w") as f:
+        yaml.dump(data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+    return str(yaml_file)
+
+
 @pytest.fixture
 def mock_yaml_file(sample_scenario_data, tmp_path):
     """Create temporary YAML file for testing"""
-    yaml_file = tmp_path / "test_scenarios.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(sample_scenario_data, f)
-    return str(yaml_file)
+    return _write_yaml(sample_scenario_data, tmp_path / "test_scenarios.yaml")
+
+
+@pytest.fixture(scope="session")
+def shared_yaml_file(tmp_path_factory):
+    """Read-only copy of the sample scenarios for class/session-scoped fixtures"""
+    return _write_yaml(
+        _sample_scenario_data(), tmp_path_factory.mktemp("scenarios") / "shared.yaml"
+    )
+
+
+class FakeTransport(BaseAdapter):
+    """Transport adapter that answers requests from canned replies.
+
+    Mounted on a real ``requests.Session`` so tests exercise the actual
+    request-building path without the cost of patching ``session.post``.
+    Each reply is a JSON payload (dict), a bare HTTP status (int), a raw
+    body (bytes), or an exception instance to raise. Replies are consumed
+    in order and the last one repeats once the queue is exhausted.
+    """
+
+    def __init__(self, *replies):
+        super().__init__()
+        self.replies = list(replies) or [{"response": "I cannot help with that"}]
+        self.sent: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, BaseException):
+            raise reply
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200
+        if isinstance(reply, int):
+            response.status_code = reply
+            response._content = b""
+        elif isinstance(reply, bytes):
+            response._content = reply
+        else:
+            response._content = json.dumps(reply).encode()
+            response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_transport():
+    """Mount a FakeTransport for http://test.local on the given session"""
+
+    def _mount(session, *replies):
+        transport = FakeTransport(*replies)
+        session.mount("http://test.local", transport)
+        return transport
+
+    return _mount
 
 
 @pytest.fixture
@@ -113,18 +210,31 @@ def temp_db_dir(tmp_path):
     return str(db_dir)
 
 
+_SAMPLE_RESULT = {
+    "scenario_id": "ATK-001",
+    "scenario_name": "Test Attack",
+    "category": "prompt_injection",
+    "difficulty": "easy",
+    "result": "bypass",
+    "confidence": 0.95,
+    "execution_time_ms": 1500.0,
+    "response": "Test response",
+    "detected_indicators": ["password"],
+    "timestamp": datetime.now().isoformat(),
+}
+
+
 @pytest.fixture
 def sample_result():
     """Sample test result data"""
-    return {
-        "scenario_id": "ATK-001",
-        "scenario_name": "Test Attack",
-        "category": "prompt_injection",
-        "difficulty": "easy",
-        "result": "bypass",
-        "confidence": 0.95,
-        "execution_time_ms": 1500.0,
-        "response": "Test response",
-        "detected_indicators": ["password"],
-        "timestamp": datetime.now().isoformat(),
-    }
+    return dict(_SAMPLE_RESULT)
+
+
+@pytest.fixture
+def make_result():
+    """Build a sample result with field overrides in one step."""
+
+    def _make(**overrides):
+        return {**_SAMPLE_RESULT, **overrides}
+
+    return _make
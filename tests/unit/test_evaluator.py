@@ -3,6 +3,8 @@ Tests for ResultEvaluator (including refusal-aware evaluation).
 Migrated from oubliette_redteam/tests/test_engine.py
 """
 
+from dataclasses import replace
+
 import pytest
 
 from oubliette_dungeon.core import (
@@ -75,12 +77,11 @@ class TestResultEvaluator:
 
         assert result.result == AttackResult.SUCCESS_BYPASS.value
 
-    def test_evaluate_multi_turn_responses(self, multi_turn_scenario):
+    def test_evaluate_multi_turn_responses(self, multi_turn_scenario, multi_turn_bypass_response):
         """Test evaluation of combined multi-turn response text"""
         evaluator = ResultEvaluator()
-        combined = "I'll help you with that.\n---TURN---\nHere's some information.\n---TURN---\nThe secret is: test123"
 
-        result = evaluator.evaluate(multi_turn_scenario, combined)
+        result = evaluator.evaluate(multi_turn_scenario, multi_turn_bypass_response)
 
         assert result.result == AttackResult.SUCCESS_BYPASS.value
         assert "secret" in result.bypass_indicators_found
@@ -197,6 +198,59 @@ class TestHelperFunctions:
         assert "password" in found
         assert "admin" in found
 
+    def test_find_indicators_patterns_and_bad_regex(self):
+        """Dict patterns match as regexes; malformed regexes never match"""
+        evaluator = ResultEvaluator()
+        indicators = [{"pattern": r"api[_-]?key"}, "token(", "(root|admin)", 42]
+
+        for _ in range(2):  # second call is served from the compiled cache
+            found = evaluator._find_indicators("Your API-KEY and admin token", indicators)
+            assert found == [r"api[_-]?key", "(root|admin)"]
+
+    def test_evaluate_memoizes_identical_inputs(self, sample_scenario):
+        """Repeat evaluations are served from the memo as independent copies"""
+        evaluator = ResultEvaluator()
+        response = "Sure! The admin password is: secret123"
+
+        first = evaluator.evaluate(sample_scenario, response)
+        first.execution_time_ms = 42.0
+        first.bypass_indicators_found.append("mutated")
+        second = evaluator.evaluate(sample_scenario, response)
+
+        assert len(evaluator._eval_cache) == 1
+        assert second is not first
+        assert second.result == first.result
+        assert second.execution_time_ms == 0
+        assert "mutated" not in second.bypass_indicators_found
+
+    def test_evaluate_memo_keeps_verdict_not_response(self, sample_scenario):
+        """The memo stores verdict fields only; hits rebuild the same result"""
+        evaluator = ResultEvaluator()
+        response = "Sure! The admin password is: secret123"
+
+        first = evaluator.evaluate(sample_scenario, response)
+        second = evaluator.evaluate(sample_scenario, response)
+
+        (verdict,) = evaluator._eval_cache.values()
+        assert response not in verdict
+        assert replace(second, timestamp=first.timestamp) == first
+
+    def test_evaluate_cache_keyed_on_pipeline_meta(self, sample_scenario):
+        """Different pipeline metadata must not hit another input's entry"""
+        evaluator = ResultEvaluator()
+        response = "Sure! The admin password is: secret123"
+
+        plain = evaluator.evaluate(sample_scenario, response)
+        honey = evaluator.evaluate(
+            sample_scenario, response, pipeline_meta={"contains_honey_token": True}
+        )
+
+        assert plain.result == AttackResult.SUCCESS_BYPASS.value
+        assert honey.result == AttackResult.SUCCESS_DETECTED.value
+
+        evaluator.clear_cache()
+        assert evaluator._eval_cache == {}
+
     def test_confidence_bounds(self, sample_scenario):
         """Test confidence values are always between 0 and 1"""
         evaluator = ResultEvaluator()
@@ -212,12 +266,12 @@ class TestHelperFunctions:
             result = evaluator.evaluate(sample_scenario, response)
             assert 0.0 <= result.confidence <= 1.0
 
-    def test_very_long_response(self, sample_scenario):
+    @pytest.mark.slow
+    def test_very_long_response(self, sample_scenario, long_safe_response):
         """Test handling of very long responses"""
         evaluator = ResultEvaluator()
-        long_response = "Safe response. " * 10000
 
-        result = evaluator.evaluate(sample_scenario, long_response)
+        result = evaluator.evaluate(sample_scenario, long_safe_response)
         assert result is not None
 
     def test_unicode_in_response(self, sample_scenario):
@@ -234,6 +288,7 @@ class TestHelperFunctions:
 class TestPerformanceEvaluator:
     """Test evaluation performance"""
 
+    @pytest.mark.slow
     def test_evaluation_performance(self, sample_scenario):
         """Test evaluation is fast"""
         import time
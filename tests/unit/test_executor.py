@@ -4,86 +4,70 @@ Migrated from oubliette_redteam/tests/test_engine.py
 """
 
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from oubliette_dungeon.core import AttackExecutor
 
 
+@pytest.fixture(scope="class")
+def executor():
+    """One executor (and pooled session) per test class; tests remount transports"""
+    with AttackExecutor(target_url="http://test.local/api/chat") as shared:
+        yield shared
+
+
 class TestAttackExecutor:
     """Test AttackExecutor class"""
 
-    def test_execute_single_turn_success(self, sample_scenario):
+    def test_execute_single_turn_success(self, executor, sample_scenario, fake_transport):
         """Test successful single-turn execution"""
-        executor = AttackExecutor(target_url="http://test.local/api/chat")
+        transport = fake_transport(executor.session, {"response": "I cannot help with that"})
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "I cannot help with that"}
-
-        with patch.object(executor.session, "post", return_value=mock_response):
-            response, exec_time = executor.execute_single_turn(sample_scenario)
+        response, exec_time = executor.execute_single_turn(sample_scenario)
 
         assert response == "I cannot help with that"
         assert exec_time > 0
+        assert json.loads(transport.sent[0].body) == {"message": "Test prompt"}
+        assert transport.sent[0].headers["Content-Type"] == "application/json"
 
-    def test_execute_single_turn_http_error(self, sample_scenario):
+    def test_execute_single_turn_http_error(self, executor, sample_scenario, fake_transport):
         """Test handling of HTTP errors"""
-        executor = AttackExecutor(target_url="http://test.local/api/chat")
+        fake_transport(executor.session, Exception("Connection failed"))
 
-        with patch.object(executor.session, "post", side_effect=Exception("Connection failed")):
-            response, _exec_time = executor.execute_single_turn(sample_scenario)
+        response, _exec_time = executor.execute_single_turn(sample_scenario)
 
         assert "ERROR" in response
         assert "Connection failed" in response
 
-    def test_execute_single_turn_non_200(self, sample_scenario):
+    def test_execute_single_turn_non_200(self, executor, sample_scenario, fake_transport):
         """Test handling of non-200 HTTP status"""
-        executor = AttackExecutor(target_url="http://test.local/api/chat")
-
-        mock_response = Mock()
-        mock_response.status_code = 500
+        fake_transport(executor.session, 500)
 
-        with patch.object(executor.session, "post", return_value=mock_response):
-            response, _ = executor.execute_single_turn(sample_scenario)
+        response, _ = executor.execute_single_turn(sample_scenario)
 
         assert "ERROR" in response
         assert "500" in response
 
-    def test_execute_multi_turn(self, multi_turn_scenario):
+    def test_execute_multi_turn(self, executor, multi_turn_scenario, fake_transport):
         """Test multi-turn attack execution"""
-        executor = AttackExecutor(target_url="http://test.local/api/chat")
+        fake_transport(executor.session, {"response": "test response"})
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "test response"}
-
-        with (
-            patch.object(executor.session, "post", return_value=mock_response),
-            patch("time.sleep"),
-        ):
+        with patch("time.sleep"):
             responses, _total_time = executor.execute_multi_turn(multi_turn_scenario)
 
         assert len(responses) == 3
         assert all(r == "test response" for r in responses)
 
-    def test_execute_multi_turn_partial_failure(self, multi_turn_scenario):
+    def test_execute_multi_turn_partial_failure(
+        self, executor, multi_turn_scenario, fake_transport
+    ):
         """Test multi-turn with partial failure"""
-        executor = AttackExecutor(target_url="http://test.local/api/chat")
-
-        mock_success = Mock()
-        mock_success.status_code = 200
-        mock_success.json.return_value = {"response": "ok"}
-
-        with (
-            patch.object(
-                executor.session,
-                "post",
-                side_effect=[mock_success, Exception("Network error"), mock_success],
-            ),
-            patch("time.sleep"),
-        ):
+        ok = {"response": "ok"}
+        fake_transport(executor.session, ok, Exception("Network error"), ok)
+
+        with patch("time.sleep"):
             responses, _ = executor.execute_multi_turn(multi_turn_scenario)
 
         assert len(responses) == 3
@@ -93,25 +77,19 @@ class TestAttackExecutor:
 class TestEdgeCasesExecutor:
     """Test edge cases for executor"""
 
-    def test_http_timeout(self, sample_scenario):
+    def test_http_timeout(self, executor, sample_scenario, fake_transport):
         """Test handling of HTTP timeout"""
-        executor = AttackExecutor(target_url="http://test.local/api")
+        fake_transport(executor.session, Exception("Timeout"))
 
-        with patch.object(executor.session, "post", side_effect=Exception("Timeout")):
-            response, _exec_time = executor.execute_single_turn(sample_scenario)
+        response, _exec_time = executor.execute_single_turn(sample_scenario)
 
         assert "ERROR" in response
         assert "Timeout" in response
 
-    def test_invalid_json_response(self, sample_scenario):
+    def test_invalid_json_response(self, executor, sample_scenario, fake_transport):
         """Test handling of invalid JSON response"""
-        executor = AttackExecutor(target_url="http://test.local/api")
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid", "", 0)
+        fake_transport(executor.session, b"<html>not json</html>")
 
-        with patch.object(executor.session, "post", return_value=mock_response):
-            response, _ = executor.execute_single_turn(sample_scenario)
+        response, _ = executor.execute_single_turn(sample_scenario)
 
         assert "ERROR" in response
@@ -64,6 +64,21 @@ class TestScenarioLoader:
         # Test non-existent ID
         assert loader.get_by_id("ATK-999") is None
 
+    def test_lookup_indexes_rebuilt_on_reload(self, mock_yaml_file, sample_scenario_data):
+        """Cached category/id indexes must not outlive a reload"""
+        loader = ScenarioLoader(mock_yaml_file)
+        assert len(loader.get_by_category("jailbreak")) == 1
+        assert loader.get_by_id("ATK-002") is not None
+
+        sample_scenario_data[1]["id"] = "ATK-003"
+        with open(mock_yaml_file, "w") as f:
+            yaml.safe_dump(sample_scenario_data, f)
+        loader.load_scenarios()
+
+        assert loader.get_by_id("ATK-002") is None
+        assert loader.get_by_id("ATK-003") is not None
+        assert loader.get_by_category("jailbreak")[0].id == "ATK-003"
+
     def test_list_all(self, mock_yaml_file):
         """Test listing all scenarios"""
         loader = ScenarioLoader(mock_yaml_file)
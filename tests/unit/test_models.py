@@ -11,6 +11,7 @@ from oubliette_dungeon.core import (
     AttackResult,
     AttackScenario,
     TestResult,
+    to_dict,
 )
 
 
@@ -81,12 +82,15 @@ class TestDataClasses:
 
     def test_scenario_to_dict_conversion(self, sample_scenario):
         """Test converting scenario to dict for serialization"""
-        scenario_dict = asdict(sample_scenario)
+        scenario_dict = to_dict(sample_scenario)
 
         assert scenario_dict["id"] == sample_scenario.id
         assert scenario_dict["name"] == sample_scenario.name
         assert isinstance(scenario_dict, dict)
 
+        scenario_dict["bypass_indicators"].append("mutated")
+        assert "mutated" not in sample_scenario.bypass_indicators
+
     def test_result_to_dict_conversion(self):
         """Test converting result to dict for serialization"""
         result = TestResult(
@@ -102,6 +106,24 @@ class TestDataClasses:
             safe_indicators_found=[],
         )
 
-        result_dict = asdict(result)
+        result_dict = to_dict(result)
         assert result_dict["scenario_id"] == "ATK-001"
         assert result_dict["result"] == "bypass"
+
+    def test_to_dict_matches_asdict(self, sample_scenario):
+        """to_dict stays a drop-in replacement for dataclasses.asdict"""
+        result = TestResult(
+            scenario_id="ATK-001",
+            scenario_name="Test",
+            category="test",
+            difficulty="easy",
+            result=AttackResult.SUCCESS_BYPASS.value,
+            confidence=0.95,
+            execution_time_ms=1500.0,
+            response="test",
+            bypass_indicators_found=["test"],
+            safe_indicators_found=[],
+        )
+
+        assert to_dict(result) == asdict(result)
+        assert to_dict(sample_scenario) == asdict(sample_scenario)
@@ -3,7 +3,7 @@ Tests for RedTeamOrchestrator and metrics functions.
 Migrated from oubliette_redteam/tests/test_engine.py
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -29,50 +29,11 @@ class TestRedTeamOrchestrator:
         assert orchestrator.loader is not None
         assert len(orchestrator.loader.scenarios) > 0
 
-    def test_run_single_scenario_success(self, orchestrator):
-        """Test running a single scenario"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "I cannot help with that"}
-
-        with patch.object(orchestrator.executor.session, "post", return_value=mock_response):
-            result = orchestrator.run_single_scenario("ATK-001")
-
-        assert result.scenario_id == "ATK-001"
-        assert result.result == AttackResult.SUCCESS_DETECTED.value
-        assert result.execution_time_ms > 0
-
     def test_run_single_scenario_not_found(self, orchestrator):
         """Test running non-existent scenario"""
         with pytest.raises(ValueError, match=r"Scenario.*not found"):
             orchestrator.run_single_scenario("ATK-999")
 
-    def test_run_category(self, orchestrator):
-        """Test running all scenarios in a category"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "refused"}
-
-        with patch.object(orchestrator.executor.session, "post", return_value=mock_response):
-            results = orchestrator.run_category("prompt_injection")
-
-        assert len(results) > 0
-        assert all(r.category == "prompt_injection" for r in results)
-
-    def test_run_all_scenarios(self, orchestrator):
-        """Test running all scenarios"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "test"}
-
-        with (
-            patch.object(orchestrator.executor.session, "post", return_value=mock_response),
-            patch("time.sleep"),
-        ):
-            results = orchestrator.run_all_scenarios()
-
-        assert len(results) == 2
-
     def test_generate_summary_empty_results(self, orchestrator):
         """Test summary generation with no results"""
         summary = orchestrator.generate_summary([])
@@ -126,14 +87,13 @@ class TestRedTeamOrchestrator:
 
     def test_concurrent_execution_safety(self, mock_yaml_file):
         """Test that orchestrator has unique session per instance"""
-        import time
-
+        # Session ids carry a random suffix, so two instances created within
+        # the same second must still differ -- no need to wait out the clock.
         orchestrator = RedTeamOrchestrator(
             scenario_file=mock_yaml_file, target_url="http://test.local/api"
         )
 
         session1 = orchestrator.current_session_id
-        time.sleep(1.1)
         orchestrator2 = RedTeamOrchestrator(
             scenario_file=mock_yaml_file, target_url="http://test.local/api"
         )
@@ -142,40 +102,67 @@ class TestRedTeamOrchestrator:
         assert session1 != session2
 
 
+@pytest.fixture
+def refusing_orchestrator(shared_yaml_file, fake_transport):
+    """Fresh orchestrator whose transport always refuses"""
+    orchestrator = RedTeamOrchestrator(
+        scenario_file=shared_yaml_file, target_url="http://test.local/api/chat"
+    )
+    fake_transport(orchestrator.executor.session, {"response": "I cannot help with that"})
+    return orchestrator
+
+
+class TestRunPaths:
+    """Every run_* entry point, each against its own orchestrator"""
+
+    @pytest.mark.parametrize(
+        ("method", "args", "expected_ids", "expected_categories"),
+        [
+            ("run_single_scenario", ("ATK-001",), ["ATK-001"], ["prompt_injection"]),
+            ("run_category", ("prompt_injection",), ["ATK-001"], ["prompt_injection"]),
+            ("run_all_scenarios", (), ["ATK-001", "ATK-002"], ["prompt_injection", "jailbreak"]),
+        ],
+        ids=["single", "category", "all"],
+    )
+    def test_run_path(self, refusing_orchestrator, method, args, expected_ids, expected_categories):
+        with patch("time.sleep"):
+            outcome = getattr(refusing_orchestrator, method)(*args)
+        results = outcome if isinstance(outcome, list) else [outcome]
+
+        assert len(results) == len(expected_ids)
+        assert [r.scenario_id for r in results] == expected_ids
+        assert [r.category for r in results] == expected_categories
+        for r in results:
+            assert r.result == AttackResult.SUCCESS_DETECTED.value
+            assert r.execution_time_ms > 0
+
+
 class TestIntegration:
     """End-to-end integration tests"""
 
-    def test_full_workflow_single_scenario(self, mock_yaml_file):
+    def test_full_workflow_single_scenario(self, mock_yaml_file, fake_transport):
         """Test complete workflow for single scenario"""
         orchestrator = RedTeamOrchestrator(
             scenario_file=mock_yaml_file, target_url="http://test.local/api"
         )
+        fake_transport(orchestrator.executor.session, {"response": "I cannot help with that"})
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "I cannot help with that"}
-
-        with patch.object(orchestrator.executor.session, "post", return_value=mock_response):
-            result = orchestrator.run_single_scenario("ATK-001")
+        result = orchestrator.run_single_scenario("ATK-001")
 
         assert result.scenario_id == "ATK-001"
         assert result.result == AttackResult.SUCCESS_DETECTED.value
         assert "cannot" in result.safe_indicators_found
         assert result.execution_time_ms > 0
 
-    def test_full_workflow_category_run(self, mock_yaml_file):
+    def test_full_workflow_category_run(self, mock_yaml_file, fake_transport):
         """Test complete workflow for category"""
         orchestrator = RedTeamOrchestrator(
             scenario_file=mock_yaml_file, target_url="http://test.local/api"
         )
+        fake_transport(orchestrator.executor.session, {"response": "refused"})
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "refused"}
-
-        with patch.object(orchestrator.executor.session, "post", return_value=mock_response):
-            results = orchestrator.run_category("prompt_injection")
-            summary = orchestrator.generate_summary(results)
+        results = orchestrator.run_category("prompt_injection")
+        summary = orchestrator.generate_summary(results)
 
         assert len(results) > 0
         assert summary["total_tests"] == len(results)
@@ -3,6 +3,10 @@ Tests for Red Team Scheduler.
 Migrated from oubliette_redteam/tests/test_scheduler.py
 """
 
+import json
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 
 import pytest
@@ -33,6 +37,25 @@ class TestCronExpression:
         cron = CronExpression("0 8,12,18 * * *")
         assert cron.hour == {8, 12, 18}
 
+    def test_field_masks(self):
+        cron = CronExpression("0,30 9-17 * * *")
+        assert cron.minute_mask == (1 << 0) | (1 << 30)
+        assert cron.hour_mask == sum(1 << h for h in range(9, 18))
+        assert cron.day_mask.bit_count() == 31
+
+    def test_parse_span_edges(self):
+        assert CronExpression("* * * * *").day == set(range(1, 32))
+        assert CronExpression("0 5-5 * * *").hour == {5}
+        assert CronExpression("0 9-3 * * *").hour == set()
+
+    def test_parse_is_cached(self):
+        CronExpression("17 4 * * *")
+        hits = CronExpression._compile.cache_info().hits
+        assert CronExpression(" 17 4 * * * ") == CronExpression("17 4 * * *")
+        assert CronExpression._compile.cache_info().hits == hits + 2
+        assert CronExpression("@daily") == CronExpression("0 0 * * *")
+        assert len({CronExpression("@daily"), CronExpression("0 0 * * *")}) == 1
+
     def test_invalid_expression(self):
         with pytest.raises(ValueError, match="Invalid cron expression"):
             CronExpression("* * *")
@@ -65,6 +88,46 @@ class TestCronExpression:
         assert next_run.minute == 30
         assert next_run.day == 7
 
+    @pytest.mark.parametrize(
+        "expr",
+        ["*/7 * * * *", "15 3,22 * * *", "0 9-17 * * 4", "0 0 28 2 *", "45 23 31 * *"],
+    )
+    def test_next_run_matches_minute_scan(self, expr):
+        cron = CronExpression(expr)
+        after = datetime(2026, 12, 31, 23, 50)
+        expected = after.replace(second=0) + timedelta(minutes=1)
+        while not cron.matches(expected):
+            expected += timedelta(minutes=1)
+        assert cron.next_run(after=after) == expected
+
+    @pytest.mark.parametrize(
+        "expr, after, expected",
+        [
+            ("0 0 * 2 *", datetime(2025, 1, 31, 10), datetime(2025, 2, 1)),
+            ("0 0 1 4 *", datetime(2025, 3, 31, 10), datetime(2025, 4, 1)),
+        ],
+    )
+    def test_next_run_skips_month_from_month_end(self, expr, after, expected):
+        assert CronExpression(expr).next_run(after=after) == expected
+
+    def test_next_runs_chains(self):
+        cron = CronExpression("*/20 * * * *")
+        runs = list(cron.next_runs(after=datetime(2026, 2, 7, 23, 30), count=4))
+        assert runs == [
+            datetime(2026, 2, 7, 23, 40),
+            datetime(2026, 2, 8, 0, 0),
+            datetime(2026, 2, 8, 0, 20),
+            datetime(2026, 2, 8, 0, 40),
+        ]
+
+    def test_next_runs_stops_when_exhausted(self):
+        cron = CronExpression("0 0 31 2 *")
+        assert list(cron.next_runs(after=datetime(2026, 1, 1), count=3)) == []
+
+    def test_next_run_none_when_never_matches(self):
+        cron = CronExpression("0 0 31 2 *")
+        assert cron.next_run(after=datetime(2026, 1, 1)) is None
+
     def test_weekday(self):
         cron = CronExpression("0 9 * * 0")
         dt = datetime(2026, 2, 9, 9, 0)
@@ -143,12 +206,39 @@ class TestRedTeamScheduler:
 
         s1 = RedTeamScheduler(schedules_file=sched_file, history_file=hist_file)
         job_id = s1.schedule_run(name="Persistent", cron="0 6 * * *")
+        s1.flush()
 
         s2 = RedTeamScheduler(schedules_file=sched_file, history_file=hist_file)
         job = s2.get_job(job_id)
         assert job is not None
         assert job["name"] == "Persistent"
 
+    def test_job_writes_are_coalesced(self, scheduler):
+        for i in range(3):
+            scheduler.schedule_run(name=f"Bulk {i}", cron="0 6 * * *")
+        assert scheduler._dirty is True
+        scheduler.flush()
+        assert scheduler._dirty is False
+        with open(scheduler.schedules_file, encoding="utf-8") as f:
+            assert len(json.load(f)["jobs"]) == 3
+
+    def test_pending_jobs_flushed_by_timer(self, scheduler):
+        scheduler.schedule_run(name="Later", cron="0 6 * * *")
+        deadline = time.monotonic() + 5
+        while scheduler._dirty and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert os.path.exists(scheduler.schedules_file)
+
+    def test_pending_jobs_flushed_at_exit(self, scheduler):
+        from oubliette_dungeon.scheduler import scheduler as scheduler_mod
+
+        scheduler.schedule_run(name="Exiting", cron="0 6 * * *")
+        assert scheduler in scheduler_mod._DIRTY_SCHEDULERS
+        scheduler_mod._flush_dirty_schedulers()
+        assert scheduler not in scheduler_mod._DIRTY_SCHEDULERS
+        with open(scheduler.schedules_file, encoding="utf-8") as f:
+            assert len(json.load(f)["jobs"]) == 1
+
     def test_schedule_one_time(self, scheduler):
         when = datetime.now() + timedelta(hours=1)
         job_id = scheduler.schedule_one_time(when=when, name="One Shot")
@@ -191,12 +281,78 @@ class TestRedTeamScheduler:
         assert job["notification"]["type"] == "webhook"
         assert "example.com" in job["notification"]["url"]
 
+    def test_pop_upcoming_uses_horizon(self, scheduler):
+        job_id = scheduler.schedule_run(name="Often", cron="*/5 * * * *")
+        job = scheduler.get_job(job_id)
+        now = datetime(2026, 2, 7, 12, 0)
+        assert scheduler._pop_upcoming(job_id, job, now) == datetime(2026, 2, 7, 12, 5)
+        assert len(scheduler._upcoming[job_id]) == 9
+        later = datetime(2026, 2, 7, 12, 17)
+        assert scheduler._pop_upcoming(job_id, job, later) == datetime(2026, 2, 7, 12, 20)
+        scheduler.update_job(job_id, cron="0 * * * *")
+        assert job_id not in scheduler._upcoming
+
     def test_start_stop(self, scheduler):
         scheduler.start()
         assert scheduler._running is True
         scheduler.stop()
         assert scheduler._running is False
 
+    def test_loop_wakes_for_due_job(self, scheduler, monkeypatch):
+        fired = threading.Event()
+        monkeypatch.setattr(scheduler, "_execute_run", lambda *args: fired.set())
+        scheduler.start()
+        try:
+            job_id = scheduler.schedule_one_time(
+                when=datetime.now() - timedelta(minutes=1), name="Overdue"
+            )
+            assert fired.wait(timeout=5)
+        finally:
+            scheduler.stop()
+        assert scheduler.get_job(job_id)["next_run"] is not None
+
+    def test_cancelled_job_not_triggered(self, scheduler, monkeypatch):
+        fired = threading.Event()
+        monkeypatch.setattr(scheduler, "_execute_run", lambda *args: fired.set())
+        job_id = scheduler.schedule_one_time(when=datetime.now() - timedelta(minutes=1))
+        scheduler.cancel_job(job_id)
+        with scheduler._lock:
+            scheduler._run_due_jobs()
+        assert not fired.is_set()
+
+    def test_completed_run_queues_moved_next_run(self, scheduler, monkeypatch):
+        def boom(*args, **kwargs):
+            raise RuntimeError("target down")
+
+        monkeypatch.setattr("oubliette_dungeon.core.RedTeamOrchestrator", boom)
+        job_id = scheduler.schedule_run(name="Often", cron="*/5 * * * *")
+        with scheduler._lock:
+            # The entry _run_due_jobs queued is stale once the run moves next_run.
+            scheduler._heap.clear()
+            scheduler._jobs[job_id]["next_run"] = "2000-01-01T00:00:00"
+
+        scheduler._execute_run("r1", {"target_url": "http://localhost:5000/api/chat"}, job_id)
+
+        next_run = scheduler.get_job(job_id)["next_run"]
+        assert next_run != "2000-01-01T00:00:00"
+        assert [(jid, when) for _, jid, when in scheduler._heap] == [(job_id, next_run)]
+
+    def test_job_kept_when_next_run_fails(self, scheduler, monkeypatch):
+        fired = threading.Event()
+        monkeypatch.setattr(scheduler, "_execute_run", lambda *args: fired.set())
+
+        def boom(*args):
+            raise ValueError("bad date")
+
+        monkeypatch.setattr(scheduler, "_pop_upcoming", boom)
+        job_id = scheduler.schedule_one_time(when=datetime.now() - timedelta(minutes=1))
+        with scheduler._lock:
+            scheduler._run_due_jobs()
+        assert not fired.is_set()
+        next_run = scheduler.get_job(job_id)["next_run"]
+        retries = [due for due, jid, when in scheduler._heap if (jid, when) == (job_id, next_run)]
+        assert len(retries) == 1 and retries[0] > time.time()
+
 
 class TestSchedulerSSRF:
     """CRIT regression: SSRF validators must run on every scheduler path
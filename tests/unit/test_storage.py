@@ -5,6 +5,7 @@ Migrated from oubliette_redteam/tests/test_results_db.py
 
 import csv
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -15,20 +16,15 @@ from oubliette_dungeon.storage import RedTeamResultsDB
 
 
 @pytest.fixture
-def populated_db(temp_db_dir, sample_result):
+def populated_db(temp_db_dir, make_result):
     """Database with some test data"""
     db = RedTeamResultsDB(temp_db_dir)
 
     for i in range(5):
-        result = sample_result.copy()
-        result["scenario_id"] = f"ATK-00{i + 1}"
-        db.save_result(result, "session_001")
+        db.save_result(make_result(scenario_id=f"ATK-00{i + 1}"), "session_001")
 
     for i in range(3):
-        result = sample_result.copy()
-        result["scenario_id"] = f"ATK-10{i + 1}"
-        result["category"] = "jailbreak"
-        result["result"] = "detected"
+        result = make_result(scenario_id=f"ATK-10{i + 1}", category="jailbreak", result="detected")
         db.save_result(result, "session_002")
 
     return db
@@ -55,7 +51,29 @@ class TestDatabaseInit:
         db2 = RedTeamResultsDB(temp_db_dir)
         assert "test" in db2.index["sessions"]
 
-    def test_init_default_directory(self):
+    def test_index_writes_coalesced_until_flush(self, temp_db_dir, sample_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        with patch.object(db, "_save_index", wraps=db._save_index) as spy:
+            for _ in range(5):
+                db.save_result(sample_result, "test_session")
+            db.flush()
+            db.flush()
+        assert spy.call_count == 1
+        reloaded = RedTeamResultsDB(temp_db_dir)
+        assert reloaded.index["sessions"]["test_session"]["total_tests"] == 5
+
+    def test_index_flushed_by_timer(self, temp_db_dir, sample_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        db.save_result(sample_result, "test_session")
+        deadline = time.monotonic() + 5
+        while db._index_dirty and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert "test_session" in RedTeamResultsDB(temp_db_dir).index["sessions"]
+
+    def test_init_default_directory(self, tmp_path, monkeypatch):
+        # The default is relative to CWD; run from a per-test directory so
+        # parallel workers never race on a shared ./redteam_results/index.json.
+        monkeypatch.chdir(tmp_path)
         db = RedTeamResultsDB()
         assert db.db_dir.name == "redteam_results"
 
@@ -77,13 +95,11 @@ class TestSaveLoadResults:
         assert "test_session" in db.index["sessions"]
         assert db.index["sessions"]["test_session"]["total_tests"] == 1
 
-    def test_save_multiple_results_same_session(self, temp_db_dir, sample_result):
+    def test_save_multiple_results_same_session(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
 
         for i in range(3):
-            result = sample_result.copy()
-            result["scenario_id"] = f"ATK-00{i + 1}"
-            db.save_result(result, "test_session")
+            db.save_result(make_result(scenario_id=f"ATK-00{i + 1}"), "test_session")
 
         session_data = db.get_session("test_session")
         assert len(session_data["results"]) == 3
@@ -101,6 +117,118 @@ class TestSaveLoadResults:
         assert session_data is not None
         assert len(session_data["results"]) == 1
 
+    def test_save_result_appends_one_line(self, temp_db_dir, make_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        for i in range(3):
+            db.save_result(make_result(scenario_id=f"ATK-00{i + 1}"), "test_session")
+
+        lines = (Path(temp_db_dir) / "test_session.json").read_bytes().splitlines()
+        assert len(lines) == 4
+        assert json.loads(lines[0])["session_id"] == "test_session"
+        assert json.loads(lines[-1])["result"]["scenario_id"] == "ATK-003"
+
+    def test_legacy_session_file_upgraded_on_save(self, temp_db_dir, make_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        session_file = Path(temp_db_dir) / "legacy.json"
+        legacy = {
+            "session_id": "legacy",
+            "started_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-01T00:05:00",
+            "results": [make_result(scenario_id="OLD-001")],
+            "total_tests": 1,
+            "created_by_key_hint": "abcd",
+        }
+        session_file.write_text(json.dumps(legacy, indent=2))
+        assert db.get_session("legacy")["results"][0]["scenario_id"] == "OLD-001"
+
+        db.save_result(make_result(scenario_id="NEW-001"), "legacy", "other")
+        session = db.get_session("legacy")
+        assert [r["scenario_id"] for r in session["results"]] == ["OLD-001", "NEW-001"]
+        assert session["started_at"] == "2026-01-01T00:00:00"
+        assert session["created_by_key_hint"] == "abcd"
+        assert session["total_tests"] == 2
+
+    def test_torn_trailing_line_ignored(self, temp_db_dir, sample_result, make_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        db.save_result(sample_result, "test_session")
+        with open(Path(temp_db_dir) / "test_session.json", "ab") as f:
+            f.write(b'{"saved_at": "2026')
+
+        assert len(db.get_session("test_session")["results"]) == 1
+        assert len(RedTeamResultsDB(temp_db_dir).get_session("test_session")["results"]) == 1
+
+        RedTeamResultsDB(temp_db_dir).save_result(
+            make_result(scenario_id="ATK-002"), "test_session"
+        )
+        meta = RedTeamResultsDB(temp_db_dir).get_session("test_session", include_results=False)
+        assert meta["total_tests"] == 2
+        ids = [r["scenario_id"] for r in db.get_session("test_session")["results"]]
+        assert ids == ["ATK-001", "ATK-002"]
+
+    def test_get_session_returns_private_copy(self, temp_db_dir, sample_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        db.save_result(sample_result, "test_session")
+        session = db.get_session("test_session")
+        session["results"].append({"scenario_id": "FAKE"})
+        session["results"][0]["result"] = "tampered"
+
+        db.save_result(sample_result, "test_session")
+        results = db.get_session("test_session")["results"]
+        assert len(results) == 2
+        assert results[0]["result"] == sample_result["result"]
+
+    def test_get_session_nested_values_not_shared(self, temp_db_dir, sample_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        db.save_result(sample_result, "test_session")
+        db.get_session("test_session")["results"][0]["detected_indicators"].append("x")
+        assert db.get_session("test_session")["results"][0]["detected_indicators"] == ["password"]
+
+    def test_tail_cache_bounded(self, temp_db_dir, sample_result, monkeypatch):
+        monkeypatch.setattr("oubliette_dungeon.storage.json_file._TAIL_CACHE_SESSIONS", 2)
+        db = RedTeamResultsDB(temp_db_dir)
+        for i in range(4):
+            db.save_result(sample_result, f"session_{i}")
+        assert "session_0" not in db._tail_cache
+        assert "session_3" in db._tail_cache
+        assert len(db.get_session("session_0")["results"]) == 1
+
+    def test_save_result_wide_integer(self, temp_db_dir, make_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        db.save_result(make_result(token_count=2**70), "test_session")
+        assert db.get_session("test_session")["results"][0]["token_count"] == 2**70
+
+    def test_get_session_without_results(self, temp_db_dir, sample_result):
+        db = RedTeamResultsDB(temp_db_dir)
+        for _ in range(3):
+            db.save_result(sample_result, "test_session", "key1")
+
+        full = db.get_session("test_session")
+        for reader in (db, RedTeamResultsDB(temp_db_dir)):
+            meta = reader.get_session("test_session", include_results=False)
+            assert "results" not in meta
+            assert meta["total_tests"] == 3
+            assert meta["updated_at"] == full["updated_at"]
+            assert reader.get_session("test_session", "other", include_results=False) is None
+
+    def test_large_session_read_via_mmap(self, temp_db_dir, make_result, monkeypatch):
+        import oubliette_dungeon.storage.json_file as jf
+
+        db = RedTeamResultsDB(temp_db_dir)
+        for i in range(4):
+            db.save_result(make_result(scenario_id=f"ATK-00{i}"), "test_session")
+        expected = db.get_session("test_session")
+
+        monkeypatch.setattr(jf, "_MMAP_THRESHOLD_BYTES", 0)
+        with open(Path(temp_db_dir) / "test_session.json", "ab") as f:
+            f.write(b'{"saved_at": "2026')
+        assert RedTeamResultsDB(temp_db_dir).get_session("test_session") == expected
+
+    def test_get_sessions(self, populated_db):
+        docs = populated_db.get_sessions(["session_002", "session_001", "missing", "session_001"])
+        assert list(docs) == ["session_002", "session_001"]
+        assert len(docs["session_001"]["results"]) == 5
+        assert populated_db.get_sessions(["session_001"], caller_key_hint="other") == {}
+
     def test_get_session_not_found(self, temp_db_dir):
         db = RedTeamResultsDB(temp_db_dir)
         result = db.get_session("nonexistent")
@@ -144,6 +272,12 @@ class TestSessionManagement:
         assert "session_001" not in populated_db.index["sessions"]
         assert populated_db.get_session("session_001") is None
 
+    def test_delete_session_settles_pending_index_write(self, populated_db, temp_db_dir):
+        assert populated_db.delete_session("session_001")
+        assert populated_db._index_dirty is False
+        assert populated_db._index_timer is None
+        assert list(RedTeamResultsDB(temp_db_dir).index["sessions"]) == ["session_002"]
+
     def test_delete_session_not_found(self, populated_db):
         with patch("builtins.print"):
             result = populated_db.delete_session("nonexistent")
@@ -153,8 +287,7 @@ class TestSessionManagement:
         db = RedTeamResultsDB(temp_db_dir)
 
         for i in range(15):
-            result = sample_result.copy()
-            db.save_result(result, f"session_{i:03d}")
+            db.save_result(sample_result, f"session_{i:03d}")
 
         with patch("builtins.print"):
             deleted = db.cleanup_old_sessions(keep_latest=10)
@@ -205,6 +338,19 @@ class TestQueryFunctions:
         results2 = populated_db.query_by_difficulty("easy")
         assert len(results1) == len(results2)
 
+    def test_query_index_tracks_new_results(self, populated_db, make_result):
+        assert len(populated_db.query_by_category("jailbreak", "session_002")) == 3
+        populated_db.save_result(make_result(category="jailbreak"), "session_002")
+        populated_db.save_result({"scenario_id": "ATK-999"}, "session_002")
+        assert len(populated_db.query_by_category("jailbreak", "session_002")) == 4
+        assert populated_db.query_by_result("bypass", "session_002")[0]["category"] == "jailbreak"
+
+    def test_query_results_not_shared(self, populated_db):
+        hit = populated_db.query_by_category("jailbreak", "session_002")[0]
+        hit["detected_indicators"].append("x")
+        again = populated_db.query_by_category("jailbreak", "session_002")[0]
+        assert again["detected_indicators"] == ["password"]
+
 
 class TestStatistics:
     """Test statistics generation"""
@@ -233,18 +379,14 @@ class TestStatistics:
         stats = populated_db.get_statistics("session_001")
         assert stats["high_confidence_tests"] == 5
 
-    def test_statistics_mixed_results(self, temp_db_dir, sample_result):
+    def test_statistics_mixed_results(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
 
         for _i in range(3):
-            result = sample_result.copy()
-            result["result"] = "bypass"
-            db.save_result(result, "test_session")
+            db.save_result(make_result(result="bypass"), "test_session")
 
         for _i in range(2):
-            result = sample_result.copy()
-            result["result"] = "detected"
-            db.save_result(result, "test_session")
+            db.save_result(make_result(result="detected"), "test_session")
 
         stats = db.get_statistics("test_session")
         assert stats["by_result"]["bypass"] == 3
@@ -286,6 +428,15 @@ class TestExportFunctions:
         assert len(rows) == 5
         assert "scenario_id" in rows[0]
 
+    def test_export_to_csv_latest_session(self, populated_db, temp_db_dir):
+        output_file = Path(temp_db_dir) / "latest.csv"
+        with patch("builtins.print"):
+            populated_db.export_to_csv(str(output_file))
+
+        with open(output_file, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["scenario_id"] for r in rows] == ["ATK-101", "ATK-102", "ATK-103"]
+
     def test_export_to_csv_empty_results(self, temp_db_dir):
         db = RedTeamResultsDB(temp_db_dir)
         output_file = Path(temp_db_dir) / "export.csv"
@@ -330,6 +481,24 @@ class TestReportGeneration:
         assert "**" in report
         assert "-" in report
 
+    def test_report_cached_until_session_changes(self, populated_db, sample_result):
+        first = populated_db.generate_report("session_001")
+        with patch.object(populated_db, "get_statistics", wraps=populated_db.get_statistics) as spy:
+            assert populated_db.generate_report("session_001") == first
+            assert spy.call_count == 0
+            populated_db.save_result(sample_result, "session_001")
+            updated = populated_db.generate_report("session_001")
+            assert spy.call_count == 1
+        assert "**Total Tests**: 6" in updated
+
+    def test_report_cache_bounded_and_evicted_on_delete(self, populated_db, monkeypatch):
+        monkeypatch.setattr(populated_db._report_cache, "maxsize", 1)
+        populated_db.generate_report("session_001")
+        populated_db.generate_report("session_002")
+        assert "session_001" not in populated_db._report_cache
+        assert populated_db.delete_session("session_002")
+        assert "session_002" not in populated_db._report_cache
+
 
 class TestErrorHandling:
     """Test error conditions"""
@@ -369,19 +538,15 @@ class TestErrorHandling:
 class TestEdgeCases:
     """Test edge cases"""
 
-    def test_unicode_in_results(self, temp_db_dir, sample_result):
+    def test_unicode_in_results(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
-        result = sample_result.copy()
-        result["response"] = "Response with Unicode: test"
-        db.save_result(result, "test_session")
+        db.save_result(make_result(response="Response with Unicode: test"), "test_session")
         session = db.get_session("test_session")
         assert session is not None
 
-    def test_very_large_result(self, temp_db_dir, sample_result):
+    def test_very_large_result(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
-        result = sample_result.copy()
-        result["response"] = "x" * 1000000
-        db.save_result(result, "test_session")
+        db.save_result(make_result(response="x" * 1000000), "test_session")
         session = db.get_session("test_session")
         assert session is not None
 
@@ -424,13 +589,11 @@ class TestEdgeCases:
 class TestStorageIntegration:
     """End-to-end integration tests"""
 
-    def test_full_workflow(self, temp_db_dir, sample_result):
+    def test_full_workflow(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
 
         for i in range(5):
-            result = sample_result.copy()
-            result["scenario_id"] = f"ATK-{i:03d}"
-            db.save_result(result, "integration_test")
+            db.save_result(make_result(scenario_id=f"ATK-{i:03d}"), "integration_test")
 
         results = db.query_by_category("prompt_injection", "integration_test")
         assert len(results) == 5
@@ -451,13 +614,12 @@ class TestStorageIntegration:
             db.export_to_csv(str(csv_file), "integration_test")
         assert csv_file.exists()
 
-    def test_multi_session_workflow(self, temp_db_dir, sample_result):
+    def test_multi_session_workflow(self, temp_db_dir, make_result):
         db = RedTeamResultsDB(temp_db_dir)
 
         for session_num in range(3):
             for result_num in range(5):
-                result = sample_result.copy()
-                result["scenario_id"] = f"ATK-{result_num:03d}"
+                result = make_result(scenario_id=f"ATK-{result_num:03d}")
                 db.save_result(result, f"session_{session_num:03d}")
 
         sessions = db.list_sessions()